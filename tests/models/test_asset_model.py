@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from wyrd.models.asset import CharacterAsset
+from wyrd.models.asset import Asset, CharacterAsset
 
 
 class TestAdjustTrack:
@@ -126,3 +126,15 @@ class TestSerialisationRoundTrip:
         assert ca.asset_key == "navigator"
         assert ca.conditions == set()
         assert ca.track_values == {}
+
+
+class TestAssetNameNorm:
+    def test_lowercases_and_joins_with_underscores(self):
+        asset = Asset(key="starship", name="Ace Pilot", category="path")
+        assert asset.name_norm == "ace_pilot"
+
+
+class TestAssetCategoryDisplay:
+    def test_title_cases_and_splits_on_underscores(self):
+        asset = Asset(key="starship", name="Starship", category="command_vehicle")
+        assert asset.category_display == "Command Vehicle"
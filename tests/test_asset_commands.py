@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from wyrd.commands.asset import handle_asset
+from wyrd.commands.asset import _find_char_asset, _is_delta, handle_asset
 from wyrd.models.asset import Asset, AssetAbility, CharacterAsset
 from wyrd.models.character import Character, Stats
 from wyrd.models.session import EntryKind, Session
@@ -102,6 +102,29 @@ class TestUpdateNamedMeter:
         mech_entries = [e for e in state.session.entries if e.kind == EntryKind.MECHANICAL]
         assert len(mech_entries) == 1
 
+    def test_exact_meter_name_beats_earlier_prefix_match(self):
+        asset_def = Asset(
+            key="mech", name="Mech", category="module", tracks={"armor": (0, 5), "arm": (0, 3)}
+        )
+        char_asset = CharacterAsset(asset_key="mech", track_values={"armor": 5, "arm": 3})
+        state = _make_state([char_asset], {"mech": asset_def})
+
+        handle_asset(state, ["mech", "arm", "-1"], set())
+        assert char_asset.track_values == {"armor": 5, "arm": 2}
+
+        handle_asset(state, ["mech", "arm", "-1"], set())
+        assert char_asset.track_values == {"armor": 5, "arm": 1}
+
+    def test_prefix_meter_name_beats_earlier_substring_match(self):
+        asset_def = Asset(
+            key="mech", name="Mech", category="module", tracks={"charge": (0, 5), "armor": (0, 3)}
+        )
+        char_asset = CharacterAsset(asset_key="mech", track_values={"charge": 5, "armor": 3})
+        state = _make_state([char_asset], {"mech": asset_def})
+
+        handle_asset(state, ["mech", "ar", "-1"], set())
+        assert char_asset.track_values == {"charge": 5, "armor": 2}
+
     @patch("wyrd.commands.asset.display.error")
     def test_invalid_meter_name_shows_error(self, mock_error):
         char_asset = CharacterAsset(asset_key="starship", track_values={"integrity": 5})
@@ -179,6 +202,60 @@ class TestErrorCases:
         mock_error.assert_called()
 
 
+class TestFindCharAsset:
+    def _defs(self) -> dict[str, Asset]:
+        return {
+            "starship_crew": Asset(key="starship_crew", name="Starship Crew", category="module"),
+            "starship": _starship_def(),
+            "combat_bot": _bot_def(),
+        }
+
+    def test_exact_match_beats_earlier_prefix_match(self):
+        owned = [CharacterAsset(asset_key="starship_crew"), CharacterAsset(asset_key="starship")]
+        state = _make_state(owned, self._defs())
+
+        result = _find_char_asset(state, "starship")
+
+        assert result is not None
+        assert result[1].key == "starship"
+
+    def test_prefix_match_beats_earlier_substring_match(self):
+        owned = [CharacterAsset(asset_key="combat_bot"), CharacterAsset(asset_key="starship")]
+        state = _make_state(owned, self._defs())
+
+        result = _find_char_asset(state, "sta")
+
+        assert result is not None
+        assert result[1].key == "starship"
+
+    def test_spaces_and_hyphens_normalise_to_underscores(self):
+        state = _make_state([CharacterAsset(asset_key="starship_crew")], self._defs())
+
+        for query in ("Starship Crew", "starship-crew"):
+            result = _find_char_asset(state, query)
+            assert result is not None
+            assert result[1].key == "starship_crew"
+
+    @patch("wyrd.commands.asset.display.warn")
+    def test_ambiguous_prefix_warns_with_all_names(self, mock_warn):
+        owned = [CharacterAsset(asset_key="starship"), CharacterAsset(asset_key="starship_crew")]
+        state = _make_state(owned, self._defs())
+
+        assert _find_char_asset(state, "star") is None
+        message = mock_warn.call_args[0][0]
+        assert "Starship" in message and "Starship Crew" in message
+
+
+class TestIsDelta:
+    def test_accepts_signed_and_unsigned_integers(self):
+        for arg in ("+2", "-1", "3", "10"):
+            assert _is_delta(arg)
+
+    def test_rejects_non_integers(self):
+        for arg in ("", "+", "-", "+-1", "++1", "1.5", "battered", "2a"):
+            assert not _is_delta(arg)
+
+
 class TestNoArgs:
     @patch("wyrd.commands.asset.display.console")
     def test_no_args_lists_assets(self, mock_console):
@@ -87,6 +87,16 @@ class TestAssetDisplay:
             assert "●" in content  # Enabled
             assert "○" in content  # Disabled
 
+    def test_display_asset_shows_readable_category(self):
+        """Underscored category keys are shown title-cased with spaces."""
+        asset = Asset(key="test", name="Test", category="command_vehicle")
+
+        with patch("wyrd.commands.asset.display.console") as mock_console:
+            _display_asset_details(asset)
+
+            content = str(mock_console.print.call_args[0][0].renderable)
+            assert "Category: Command Vehicle" in content
+
     def test_display_asset_with_multiple_tracks(self):
         """Multiple condition meters should all be displayed."""
         asset = Asset(
@@ -216,6 +226,7 @@ class TestAssetCategoryDisplay:
 
         mock_state = MagicMock(spec=GameState)
         mock_state.assets = self.assets
+        mock_state.assets_by_category = ()
 
         with patch("wyrd.commands.asset.display.console") as mock_console:
             from wyrd.commands.asset import _list_assets
@@ -226,6 +237,25 @@ class TestAssetCategoryDisplay:
             # Check that print was called multiple times (once per category + header)
             assert mock_console.print.call_count > 1
 
+    def test_uses_prebuilt_grouping_from_state(self):
+        """A grouping built at load time is printed as-is without regrouping."""
+        from wyrd.loop import GameState
+
+        mock_state = MagicMock(spec=GameState)
+        mock_state.assets = self.assets
+        mock_state.assets_by_category = (("Module", "Prebuilt"),)
+
+        with (
+            patch("wyrd.commands.asset.display.console") as mock_console,
+            patch("wyrd.commands.asset.group_assets_by_category") as mock_group,
+        ):
+            from wyrd.commands.asset import _list_assets
+
+            _list_assets(mock_state)
+
+        mock_group.assert_not_called()
+        mock_console.print.assert_called_with("[bold]Module:[/bold] Prebuilt")
+
     def test_empty_assets_shows_warning(self):
         """Empty asset dictionary should show warning."""
         from wyrd.loop import GameState
@@ -242,6 +272,31 @@ class TestAssetCategoryDisplay:
             mock_warn.assert_called_once()
 
 
+class TestAbilityRenderCache:
+    def test_ability_text_rendered_once_across_displays(self):
+        """Re-displaying an asset reuses the rendered ability markup."""
+        from wyrd.commands.asset import _render_ability
+
+        _render_ability.cache_clear()
+        asset = Asset(
+            key="cached",
+            name="Cached",
+            category="module",
+            abilities=[AssetAbility(text="**Bold** move"), AssetAbility(text="Plain")],
+        )
+
+        with (
+            patch("wyrd.commands.asset.display.console"),
+            patch(
+                "wyrd.commands.asset.display.render_game_text", side_effect=render_game_text
+            ) as mock_render,
+        ):
+            _display_asset_details(asset)
+            _display_asset_details(asset)
+
+        assert mock_render.call_count == 2
+
+
 class TestAssetEdgeCases:
     """Test edge cases and boundary conditions for asset display."""
 
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from wyrd.engine.assets import fuzzy_match_asset, load_assets
+from wyrd.engine.assets import fuzzy_match_asset, group_assets_by_category, load_assets
 from wyrd.models.asset import Asset, AssetAbility, CharacterAsset
 
 DATA_DIR = Path(__file__).parent.parent / "wyrd" / "data"
@@ -70,6 +70,24 @@ class TestFuzzyMatchAsset:
         assert len(results) > 0
 
 
+class TestGroupAssetsByCategory:
+    def test_groups_sorted_by_category_then_name(self):
+        assets = {
+            "starship": Asset(key="starship", name="Starship", category="command_vehicle"),
+            "rover": Asset(key="rover", name="Rover", category="support_vehicle"),
+            "ace": Asset(key="ace", name="Ace", category="path"),
+            "bounty_hunter": Asset(key="bounty_hunter", name="Bounty Hunter", category="path"),
+        }
+        assert group_assets_by_category(assets) == (
+            ("Command Vehicle", "Starship"),
+            ("Path", "Ace, Bounty Hunter"),
+            ("Support Vehicle", "Rover"),
+        )
+
+    def test_empty_catalog(self):
+        assert group_assets_by_category({}) == ()
+
+
 class TestCharacterAssetBackwardCompatibility:
     def test_character_from_dict_old_format(self):
         """Test loading old save format with assets as list[str]."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +15,7 @@ from wyrd.state.campaign import (
     load_campaign,
     player_save_path,
     save_campaign,
+    scan_campaigns,
 )
 
 # ---------------------------------------------------------------------------
@@ -138,6 +140,48 @@ class TestLoadSaveCampaign:
         assert loaded.campaign_dir == tmp_path
 
 
+class TestScanCampaigns:
+    def test_empty_when_no_campaigns_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wyrd.state.campaign.campaigns_dir", lambda: tmp_path / "nonexistent")
+        assert scan_campaigns() == []
+
+    def test_returns_sorted_slugs_with_players(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wyrd.state.campaign.campaigns_dir", lambda: tmp_path / "campaigns")
+        create_campaign("Beta", "kira")
+        _, alpha_dir = create_campaign("Alpha", "kira")
+        join_campaign(alpha_dir, "dax")
+        assert scan_campaigns() == [("alpha", ("kira", "dax")), ("beta", ("kira",))]
+
+    def test_unreadable_campaign_has_no_players(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wyrd.state.campaign.campaigns_dir", lambda: tmp_path / "campaigns")
+        (tmp_path / "campaigns" / "broken").mkdir(parents=True)
+        (tmp_path / "campaigns" / "broken" / "campaign.toml").write_text("not = [toml")
+        (tmp_path / "campaigns" / "empty").mkdir()
+        assert scan_campaigns() == [("broken", None), ("empty", None)]
+
+    def test_corrupt_campaign_has_no_players(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wyrd.state.campaign.campaigns_dir", lambda: tmp_path / "campaigns")
+        (tmp_path / "campaigns" / "binary").mkdir(parents=True)
+        (tmp_path / "campaigns" / "binary" / "campaign.toml").write_bytes(b"name = '\xff\xfe'")
+        (tmp_path / "campaigns" / "listed").mkdir()
+        (tmp_path / "campaigns" / "listed" / "campaign.toml").write_text('players = ["kira"]')
+        (tmp_path / "campaigns" / "scalar").mkdir()
+        (tmp_path / "campaigns" / "scalar" / "campaign.toml").write_text('players = "kira"')
+        assert scan_campaigns() == [("binary", None), ("listed", None), ("scalar", None)]
+
+    def test_rereads_players_when_file_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wyrd.state.campaign.campaigns_dir", lambda: tmp_path / "campaigns")
+        _, campaign_dir = create_campaign("Iron Veil", "kira")
+        assert scan_campaigns() == [("iron-veil", ("kira",))]
+
+        join_campaign(campaign_dir, "dax")
+        toml_path = campaign_dir / "campaign.toml"
+        st = toml_path.stat()
+        os.utime(toml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert scan_campaigns() == [("iron-veil", ("kira", "dax"))]
+
+
 class TestPlayerSavePath:
     def test_returns_json_path(self, tmp_path):
         p = player_save_path(tmp_path, "Kira Thane")
@@ -281,6 +325,26 @@ def _make_state(tmp_path):
     )
 
 
+class TestHandleCampaignDispatch:
+    @pytest.mark.parametrize("sub", ["start", "create", "join", "status", "leave"])
+    def test_subcommand_routes_to_handler(self, tmp_path, sub):
+        from wyrd.commands import campaign as campaign_cmd
+
+        state = _make_state(tmp_path)
+        handler = MagicMock()
+        with patch.dict(campaign_cmd._SUBCOMMANDS, {sub: handler}):
+            campaign_cmd.handle_campaign(state, [sub.upper()], set())
+        handler.assert_called_once_with(state)
+
+    def test_unknown_subcommand_without_campaign_shows_help(self, tmp_path):
+        from wyrd.commands.campaign import handle_campaign
+
+        state = _make_state(tmp_path)
+        with patch("wyrd.commands.campaign._show_no_campaign_help") as mock_help:
+            handle_campaign(state, ["bogus"], set())
+        mock_help.assert_called_once()
+
+
 class TestHandleStart:
     def test_solo_updates_state(self, tmp_path, monkeypatch):
         """Solo path replaces character and saves."""
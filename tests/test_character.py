@@ -1,5 +1,7 @@
 """Tests for the Character model."""
 
+import pytest
+
 from wyrd.models.character import (
     MOMENTUM_MAX_BASE,
     MOMENTUM_RESET_BASE,
@@ -44,6 +46,14 @@ class TestCharacter:
         new = self.char.adjust_track("health", -5)
         assert new == 0
 
+    def test_get_track(self):
+        self.char.spirit = 2
+        assert self.char.get_track("spirit") == 2
+
+    def test_adjust_track_rejects_unknown_track(self):
+        with pytest.raises(KeyError):
+            self.char.adjust_track("momentum", 1)
+
     def test_adjust_momentum(self):
         self.char.momentum = 2
         new = self.char.adjust_momentum(3)
@@ -319,6 +329,33 @@ class TestDebilities:
         assert restored.momentum_max == MOMENTUM_MAX_BASE - 2
         assert restored.momentum_reset == 0
 
+    def test_bounds_computed_for_constructor_debilities(self):
+        char = Character.from_dict({"name": "Test", "debilities": ["wounded", "shaken"]})
+        assert char.momentum_max == MOMENTUM_MAX_BASE - 2
+        assert char.momentum_reset == 0
+
+    def test_bounds_restored_when_debility_removed(self):
+        self.char.toggle_debility("wounded")
+        self.char.toggle_debility("shaken")
+        self.char.toggle_debility("shaken")
+        assert self.char.momentum_max == MOMENTUM_MAX_BASE - 1
+        assert self.char.momentum_reset == MOMENTUM_RESET_BASE
+
+    def test_debilities_reports_active_names(self):
+        self.char.toggle_debility("Maimed")
+        self.char.toggle_debility("shaken")
+        assert self.char.debilities == {"maimed", "shaken"}
+
+    def test_to_dict_lists_debilities_in_canonical_order(self):
+        self.char.toggle_debility("corrupted")
+        self.char.toggle_debility("wounded")
+        assert self.char.to_dict()["debilities"] == ["wounded", "corrupted"]
+
+    def test_from_dict_ignores_unknown_debilities(self):
+        char = Character.from_dict({"name": "Test", "debilities": ["wounded", "cursed"]})
+        assert char.debilities == {"wounded"}
+        assert char.momentum_max == MOMENTUM_MAX_BASE - 1
+
     def test_invalid_debility_returns_none(self):
         """Invalid debility names return None instead of raising."""
         result = self.char.toggle_debility("invincible")
@@ -1,7 +1,10 @@
 """Tests for character command handlers."""
 
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
+from rich.console import Console
+
 from wyrd.commands.character import (
     handle_char,
     handle_momentum,
@@ -196,6 +199,20 @@ class TestHandleSettings:
         assert any("Dice mode: digital" in call for call in calls)
         assert any("Usage" in call for call in calls)
 
+    def test_handle_settings_writes_output_in_one_flush(self):
+        """handle_settings buffers its lines and writes them to the terminal once."""
+        buf = StringIO()
+        console = Console(file=buf, force_terminal=False)
+        with (
+            patch("wyrd.ui.display.console", console),
+            patch.object(buf, "write", wraps=buf.write) as mock_write,
+        ):
+            handle_settings(self.state, [], set())
+
+        mock_write.assert_called_once()
+        assert "Adventures directory" in buf.getvalue()
+        assert "Usage" in buf.getvalue()
+
     @patch("wyrd.commands.character.display.success")
     @patch("wyrd.commands.character.make_dice_provider")
     def test_handle_settings_change_dice_mode(self, mock_make_dice, mock_success):
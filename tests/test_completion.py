@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 from prompt_toolkit.document import Document
 
 from wyrd.commands.completion import CommandCompleter
@@ -72,6 +74,46 @@ class TestCommandCompleter:
         # Should get all commands + aliases
         assert len(completions) > 15  # At least 15 commands available
 
+    def test_slash_only_lists_every_command_alphabetically(self):
+        completer = CommandCompleter()
+        doc = Document("/", cursor_position=1)
+        texts = [c.text for c in completer.get_completions(doc, None)]
+
+        assert texts == sorted(completer.commands)
+
+    def test_command_table_is_parsed_once_per_process(self):
+        first = CommandCompleter()
+        second = CommandCompleter()
+
+        assert first._command_trie is second._command_trie
+        assert first.command_meta == second.command_meta
+        assert first.command_meta["/help"] == "show help"
+
+    def test_exact_alias_is_offered_first(self):
+        completer = CommandCompleter()
+        doc = Document("/o", cursor_position=2)
+        completions = list(completer.get_completions(doc, None))
+
+        assert completions[0].text == "/o"
+        assert "alias for /oracle" in str(completions[0].display_meta)
+        assert "/oracle" in [c.text for c in completions[1:]]
+
+    def test_repeated_prefix_reuses_completion_objects(self):
+        completer = CommandCompleter()
+        doc = Document("/mo", cursor_position=3)
+
+        first = list(completer.get_completions(doc, None))
+        second = list(completer.get_completions(doc, None))
+
+        assert [c.text for c in first] == ["/momentum", "/move"]
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_unknown_prefix_has_no_completions(self):
+        completer = CommandCompleter()
+        doc = Document("/zzz", cursor_position=4)
+
+        assert list(completer.get_completions(doc, None)) == []
+
     def test_case_insensitive_completion(self):
         completer = CommandCompleter()
         doc = Document("/MOV", cursor_position=4)
@@ -268,6 +310,20 @@ class TestMoveCompletion:
         # display_meta is a FormattedText, check if it contains the string
         assert "Face Danger" in str(face_completions[0].display_meta)
 
+    def test_only_the_typed_argument_is_normalized_per_keystroke(self):
+        moves = {
+            "face_danger": {"name": "Face Danger", "category": "adventure"},
+            "strike": {"name": "Strike", "category": "combat"},
+        }
+        completer = CommandCompleter(moves=moves)
+        completer._normalize = MagicMock(wraps=CommandCompleter._normalize)
+
+        doc = Document("/move fa", cursor_position=8)
+        completions = list(completer.get_completions(doc, None))
+
+        assert [c.text for c in completions] == ["face_danger"]
+        completer._normalize.assert_called_once_with("fa")
+
     def test_completes_move_with_alias(self):
         moves = {
             "secure_an_advantage": {
@@ -378,6 +434,62 @@ class TestMoveCompletion:
         assert completion_texts == ["aid_your_ally", "face_danger", "strike"]
 
 
+class TestTrigramIndex:
+    def _completer(self) -> CommandCompleter:
+        moves = {
+            "face_danger": {"name": "Face Danger"},
+            "secure_an_advantage": {"name": "Secure an Advantage"},
+            "strike": {"name": "Strike"},
+            "swear_an_iron_vow": {"name": "Swear an Iron Vow"},
+        }
+        return CommandCompleter(moves=moves)
+
+    def _texts(self, completer: CommandCompleter, line: str) -> list[str]:
+        doc = Document(line, cursor_position=len(line))
+        return [c.text for c in completer.get_completions(doc, None)]
+
+    def test_long_query_matches_mid_word_substrings(self):
+        assert self._texts(self._completer(), "/move n_adv") == ["secure_an_advantage"]
+        assert self._texts(self._completer(), "/move rike") == ["strike"]
+
+    def test_shared_trigrams_without_substring_do_not_match(self):
+        # Both trigrams of "abcd" occur in "abc xbcd", but "abcd" itself does not
+        completer = CommandCompleter(moves={"abc_xbcd": {"name": "Abc Xbcd"}})
+        assert self._texts(completer, "/move abcd") == []
+        assert self._texts(completer, "/move xbcd") == ["abc_xbcd"]
+        assert self._texts(self._completer(), "/move strke") == []
+
+    def test_prefix_and_substring_matches_stay_in_key_order(self):
+        completer = CommandCompleter(
+            moves={
+                "face_danger": {"name": "Face Danger"},
+                "danger_zone": {"name": "Danger Zone"},
+                "battle_danger": {"name": "Battle Danger"},
+            }
+        )
+        assert self._texts(completer, "/move dang") == [
+            "battle_danger",
+            "danger_zone",
+            "face_danger",
+        ]
+
+    def test_replacing_catalog_rebuilds_index(self):
+        completer = self._completer()
+        assert self._texts(completer, "/move clash") == []
+
+        completer.moves = {"clash": {"name": "Clash", "category": "combat"}}
+        assert self._texts(completer, "/move clash") == ["clash"]
+        assert self._texts(completer, "/move category:") == ["combat"]
+        assert self._texts(completer, "/move strike") == []
+
+    def test_short_query_scans_everything(self):
+        assert self._texts(self._completer(), "/move an") == [
+            "face_danger",
+            "secure_an_advantage",
+            "swear_an_iron_vow",
+        ]
+
+
 class TestAssetCompletion:
     class MockAsset:
         """Simple mock asset for testing."""
@@ -15,7 +15,7 @@ class TestCommandCompleterBasics:
     def test_completes_slash_commands(self):
         """Should complete commands starting with /."""
         doc = Document("/mov", cursor_position=4)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "/move" in completion_texts or "move" in completion_texts
@@ -23,7 +23,7 @@ class TestCommandCompleterBasics:
     def test_completes_truths_command(self):
         """Should complete /truths command."""
         doc = Document("/tru", cursor_position=4)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "/truths" in completion_texts
@@ -31,7 +31,7 @@ class TestCommandCompleterBasics:
     def test_completes_command_aliases(self):
         """Should complete command aliases."""
         doc = Document("/m", cursor_position=2)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Should return completions for /m
         assert len(completions) > 0
@@ -42,14 +42,14 @@ class TestCommandCompleterBasics:
     def test_no_completions_for_non_slash(self):
         """Should not complete if input doesn't start with /."""
         doc = Document("hello", cursor_position=5)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         assert len(completions) == 0
 
     def test_empty_input_returns_no_completions(self):
         """Empty input should return no completions."""
         doc = Document("", cursor_position=0)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         assert len(completions) == 0
 
@@ -92,7 +92,7 @@ class TestOracleCompletion:
     def test_oracle_completion_shows_all_tables(self):
         """Oracle completion with no args should show all tables."""
         doc = Document("/oracle ", cursor_position=8)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "action" in completion_texts
@@ -102,7 +102,7 @@ class TestOracleCompletion:
     def test_oracle_completion_filters_by_prefix(self):
         """Oracle completion should filter by prefix."""
         doc = Document("/oracle action", cursor_position=14)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "action" in completion_texts
@@ -113,7 +113,7 @@ class TestOracleCompletion:
     def test_oracle_completion_shows_full_names(self):
         """Oracle completion should show full table names in meta."""
         doc = Document("/oracle action", cursor_position=14)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Check that display_meta contains full names
         metas = [str(c.display_meta) for c in completions if c.display_meta]
@@ -122,7 +122,7 @@ class TestOracleCompletion:
     def test_oracle_completion_matches_table_name(self):
         """Oracle completion should match against table name too."""
         doc = Document("/oracle planet", cursor_position=14)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "planet_class" in completion_texts
@@ -130,7 +130,7 @@ class TestOracleCompletion:
     def test_oracle_alias_completion(self):
         """/o alias should complete oracle tables."""
         doc = Document("/o ", cursor_position=3)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "action" in completion_texts
@@ -151,7 +151,7 @@ class TestMoveCompletion:
     def test_move_completion_shows_all_moves(self):
         """Move completion with no args should show all moves."""
         doc = Document("/move ", cursor_position=6)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "strike" in completion_texts
@@ -161,7 +161,7 @@ class TestMoveCompletion:
     def test_move_completion_filters_by_prefix(self):
         """Move completion should filter by prefix."""
         doc = Document("/move face", cursor_position=10)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "face_danger" in completion_texts
@@ -171,7 +171,7 @@ class TestMoveCompletion:
     def test_move_completion_shows_full_names(self):
         """Move completion should show full move names in meta."""
         doc = Document("/move strike", cursor_position=12)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Check that display_meta contains full name
         metas = [str(c.display_meta) for c in completions if c.display_meta]
@@ -180,7 +180,7 @@ class TestMoveCompletion:
     def test_move_completion_matches_move_name(self):
         """Move completion should match against move name too."""
         doc = Document("/move secure", cursor_position=12)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "secure_an_advantage" in completion_texts
@@ -188,7 +188,7 @@ class TestMoveCompletion:
     def test_move_alias_completion(self):
         """/m alias should complete moves."""
         doc = Document("/m ", cursor_position=3)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "strike" in completion_texts
@@ -196,7 +196,7 @@ class TestMoveCompletion:
     def test_move_completion_normalizes_spaces_and_underscores(self):
         """Move completion should handle spaces and underscores."""
         doc = Document("/move face danger", cursor_position=17)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "face_danger" in completion_texts
@@ -234,7 +234,7 @@ class TestAssetCompletion:
     def test_asset_completion_shows_all_assets(self):
         """Asset completion with no args should show all assets."""
         doc = Document("/asset ", cursor_position=7)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "starship" in completion_texts
@@ -244,7 +244,7 @@ class TestAssetCompletion:
     def test_asset_completion_filters_by_prefix(self):
         """Asset completion should filter by prefix."""
         doc = Document("/asset nav", cursor_position=10)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "navigator" in completion_texts
@@ -254,7 +254,7 @@ class TestAssetCompletion:
     def test_asset_completion_shows_full_names(self):
         """Asset completion should show full asset names in meta."""
         doc = Document("/asset starship", cursor_position=15)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Check that display_meta contains full name
         metas = [str(c.display_meta) for c in completions if c.display_meta]
@@ -263,7 +263,7 @@ class TestAssetCompletion:
     def test_asset_completion_matches_asset_name(self):
         """Asset completion should match against asset name too."""
         doc = Document("/asset engine", cursor_position=13)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "engine_upgrade" in completion_texts
@@ -271,7 +271,7 @@ class TestAssetCompletion:
     def test_asset_completion_normalizes_spaces_and_underscores(self):
         """Asset completion should handle spaces and underscores."""
         doc = Document("/asset engine upgrade", cursor_position=21)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "engine_upgrade" in completion_texts
@@ -286,7 +286,7 @@ class TestTruthsCompletion:
     def test_truths_completion_shows_all_subcommands(self):
         """Truths completion with no args should show all subcommands."""
         doc = Document("/truths ", cursor_position=8)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "start" in completion_texts
@@ -295,7 +295,7 @@ class TestTruthsCompletion:
     def test_truths_completion_filters_by_prefix(self):
         """Truths completion should filter by prefix."""
         doc = Document("/truths st", cursor_position=10)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "start" in completion_texts
@@ -305,7 +305,7 @@ class TestTruthsCompletion:
     def test_truths_completion_shows_descriptions(self):
         """Truths completion should show descriptions in meta."""
         doc = Document("/truths start", cursor_position=13)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Check that display_meta contains descriptions
         metas = [str(c.display_meta) for c in completions if c.display_meta]
@@ -321,7 +321,7 @@ class TestGuideCompletion:
     def test_guide_completion_shows_all_subcommands(self):
         """Guide completion with no args should show all subcommands."""
         doc = Document("/guide ", cursor_position=7)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "start" in completion_texts
@@ -362,7 +362,7 @@ class TestCompletionEdgeCases:
     def test_completion_with_trailing_spaces(self):
         """Should handle multiple trailing spaces."""
         doc = Document("/oracle  ", cursor_position=9)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Should still provide completions
         assert len(completions) > 0
@@ -370,7 +370,7 @@ class TestCompletionEdgeCases:
     def test_completion_case_insensitive(self):
         """Completion should be case-insensitive."""
         doc = Document("/oracle ACTION", cursor_position=14)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         completion_texts = [c.text for c in completions]
         assert "action" in completion_texts
@@ -378,7 +378,7 @@ class TestCompletionEdgeCases:
     def test_completion_with_multiple_words(self):
         """Should complete based on last word in multi-word input."""
         doc = Document("/oracle action theme", cursor_position=20)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Should attempt completion based on "theme"
         assert isinstance(completions, list)
@@ -386,7 +386,7 @@ class TestCompletionEdgeCases:
     def test_completion_with_cursor_in_middle(self):
         """Should complete based on text before cursor."""
         doc = Document("/oracle action", cursor_position=10)  # cursor after "act"
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Should complete based on "act" not "action"
         assert isinstance(completions, list)
@@ -397,7 +397,7 @@ class TestCompletionEdgeCases:
         self.completer.assets["broken"] = type("MockAsset", (), {})()
 
         doc = Document("/asset ", cursor_position=7)
-        completions = self.completer.get_completions(doc, None)
+        completions = list(self.completer.get_completions(doc, None))
 
         # Should not crash
         assert isinstance(completions, list)
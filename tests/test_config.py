@@ -0,0 +1,42 @@
+"""Tests for configuration path handling."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from wyrd.config import Config
+
+
+class TestAdventuresDir:
+    def setup_method(self):
+        Config().reset()
+
+    def teardown_method(self):
+        Config().reset()
+
+    def test_default_is_under_home(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        Config().reset()
+        assert Config().adventures_dir == tmp_path / "wyrd-adventures"
+
+    def test_home_dir_is_refreshed_on_reset(self, monkeypatch, tmp_path):
+        """The home directory is captured once and only re-read by Config.reset()."""
+        monkeypatch.setenv("HOME", str(tmp_path / "first"))
+        Config().reset()
+        first = Config().adventures_dir
+
+        monkeypatch.setenv("HOME", str(tmp_path / "second"))
+        assert Config().adventures_dir == first
+
+        Config().reset()
+        assert Config().adventures_dir == tmp_path / "second" / "wyrd-adventures"
+
+    def test_cli_override_takes_priority(self, tmp_path):
+        Config().set_adventures_dir(tmp_path)
+        assert Config().adventures_dir == tmp_path.resolve()
+        assert Config().saves_dir() == tmp_path.resolve() / "saves"
+
+    def test_override_expands_user(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        Config().set_adventures_dir("~/games")
+        assert Config().adventures_dir == Path(tmp_path / "games").resolve()
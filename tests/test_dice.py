@@ -1,5 +1,10 @@
 """Tests for the dice engine."""
 
+import random
+import subprocess
+import sys
+from unittest.mock import patch
+
 from wyrd.engine.dice import (
     DiceMode,
     Die,
@@ -32,6 +37,33 @@ class TestDigitalDice:
             result = dice.roll(Die.D100)
             assert 1 <= result <= 100
 
+    def test_rolls_use_die_range_bounds(self):
+        with patch("random.randrange", return_value=7) as mock_randrange:
+            assert DigitalDice().roll(Die.D10) == 7
+        mock_randrange.assert_called_once_with(1, 11)
+
+    def test_d6_covers_full_range(self):
+        dice = DigitalDice()
+        assert {dice.roll(Die.D6) for _ in range(500)} == set(range(1, 7))
+
+    def test_respects_random_seed(self):
+        dice = DigitalDice()
+        random.seed(1234)
+        first = [dice.roll(Die.D10) for _ in range(20)]
+        random.seed(1234)
+        second = [dice.roll(Die.D10) for _ in range(20)]
+        assert first == second
+
+
+class TestImportCost:
+    def test_importing_dice_does_not_load_rich(self):
+        """Digital rolls never need Rich, so importing the engine shouldn't pull it in."""
+        code = "import sys, wyrd.engine.dice; print('rich' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "False"
+
 
 class TestMixedDice:
     def test_defaults_to_digital(self):
@@ -61,6 +93,13 @@ class TestMakeDiceProvider:
         provider = make_dice_provider(DiceMode.MIXED)
         assert isinstance(provider, MixedDice)
 
+    def test_returns_fresh_provider_per_call(self):
+        provider = make_dice_provider(DiceMode.MIXED)
+        provider.set_manual(True)
+        other = make_dice_provider(DiceMode.MIXED)
+        assert other is not provider
+        assert provider._force_physical is True
+
 
 class TestRollHelpers:
     def test_roll_action_dice_returns_three_values(self):
@@ -1,6 +1,7 @@
 """Tests for the guide command."""
 
-from unittest.mock import MagicMock
+import io
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -9,6 +10,7 @@ from wyrd.engine.dice import DiceMode, make_dice_provider
 from wyrd.models.character import Character, Stats
 from wyrd.models.session import Session
 from wyrd.models.vow import Vow, VowRank
+from wyrd.ui import display
 
 
 @pytest.fixture
@@ -108,3 +110,180 @@ class TestGuideCommand:
 
         # Should show main guide since invalid step is not recognized
         assert "START" in captured.out or len(captured.out) > 0
+
+    def test_guide_overview_prints_in_few_blocks(self, mock_state):
+        """The overview is emitted as a handful of blocks, not one print per line."""
+        with patch("wyrd.commands.guide.display.console.print") as mock_print:
+            handle_guide(mock_state, [], set())
+
+        # flowchart, rule, blank, suggestions, footer, plus the two rules' own prints
+        assert mock_print.call_count <= 7
+
+    def test_guide_overview_reuses_parsed_flowchart(self, mock_state):
+        """The static flowchart is parsed on first use and the same Text is reprinted."""
+        from wyrd.commands.guide import _LOOP_MARKUP
+
+        with patch("wyrd.commands.guide.display.console.print") as mock_print:
+            handle_guide(mock_state, [], set())
+            handle_guide(mock_state, [], set())
+
+        loop_text = display.static_text(_LOOP_MARKUP)
+        printed = [c.args[0] for c in mock_print.call_args_list if c.args]
+        assert sum(1 for p in printed if p is loop_text) == 2
+
+
+class TestStepPanelCache:
+    """Step help panels are built once per distinct set of counts."""
+
+    def test_repeated_step_reuses_panel(self):
+        from wyrd.commands.guide import _step_panel
+
+        assert _step_panel("envision") is _step_panel("envision")
+
+    def test_counts_are_part_of_the_key(self):
+        from wyrd.commands.guide import _step_panel
+
+        assert _step_panel("oracle", oracle_count=3) is _step_panel("oracle", oracle_count=3)
+        assert _step_panel("oracle", oracle_count=3) is not _step_panel("oracle", oracle_count=4)
+
+    def test_oracle_count_is_rendered(self, mock_state, capsys):
+        mock_state.oracles = {"a": 1, "b": 2, "c": 3}
+        handle_guide(mock_state, ["oracle"], set())
+
+        assert "3" in capsys.readouterr().out
+
+
+class TestGuideProseLoading:
+    """guide.toml is parsed on first use and only once."""
+
+    def test_prose_is_parsed_once(self, mock_state):
+        import tomllib
+
+        from wyrd.commands import guide
+
+        guide._load_guide_prose.cache_clear()
+        guide._step_panel.cache_clear()
+        with patch("tomllib.load", wraps=tomllib.load) as mock_load:
+            handle_guide(mock_state, ["envision"], set())
+            handle_guide(mock_state, ["outcome"], set())
+
+        assert mock_load.call_count == 1
+
+
+class TestGuideOutputBatching:
+    """Each /guide page reaches the terminal as a single write."""
+
+    @pytest.mark.parametrize("args", [[], ["envision"], ["move"]])
+    def test_page_is_written_once(self, mock_state, args):
+        from wyrd.ui import display
+
+        class Sink(io.StringIO):
+            writes = 0
+
+            def write(self, text: str) -> int:
+                Sink.writes += 1
+                return super().write(text)
+
+        with patch.object(display.console, "_file", Sink()):
+            handle_guide(mock_state, args, set())
+
+        assert Sink.writes == 1
+
+
+class TestGuideDispatch:
+    """Subcommands are matched case-insensitively through one lookup."""
+
+    def test_start_enters_guided_mode(self, mock_state):
+        with patch("wyrd.commands.guide.start_guided_mode") as mock_start:
+            handle_guide(mock_state, ["START"], set())
+        mock_start.assert_called_once_with(mock_state)
+
+    def test_stop_leaves_guided_mode(self, mock_state):
+        with patch("wyrd.commands.guide.stop_guided_mode") as mock_stop:
+            handle_guide(mock_state, ["Stop"], set())
+        mock_stop.assert_called_once_with(mock_state)
+
+    def test_sector_start_runs_sector_wizard(self, mock_state):
+        with patch("wyrd.commands.guide.start_guided_mode") as mock_start:
+            handle_guide(mock_state, ["sector", "Start"], set())
+        mock_start.assert_called_once_with(mock_state, mode="sector")
+
+    def test_sector_alone_shows_sector_help(self, mock_state):
+        with (
+            patch("wyrd.commands.guide.start_guided_mode") as mock_start,
+            patch("wyrd.commands.guide._show_step_help") as mock_help,
+        ):
+            handle_guide(mock_state, ["sector"], set())
+        mock_start.assert_not_called()
+        mock_help.assert_called_once_with("sector", mock_state)
+
+
+class TestPlainRule:
+    """The untitled separator is built once and shared."""
+
+    def test_untitled_rule_is_shared(self):
+        from wyrd.ui import display
+
+        with patch.object(display.console, "print") as mock_print:
+            display.rule()
+            display.rule()
+
+        first, second = (c.args[0] for c in mock_print.call_args_list)
+        assert first is second is display._PLAIN_RULE
+
+    def test_titled_rule_keeps_its_title(self):
+        from wyrd.ui import display
+
+        with patch.object(display.console, "print") as mock_print:
+            display.rule("Game Loop")
+
+        assert mock_print.call_args.args[0].title == "Game Loop"
+
+
+class TestContextualSuggestions:
+    """Suggestions reflect vows, tracks and session progress."""
+
+    def test_counts_only_unfulfilled_vows(self, mock_state, capsys):
+        done = Vow(description="Done", rank=VowRank.TROUBLESOME)
+        done.fulfilled = True
+        mock_state.vows.append(done)
+        handle_guide(mock_state, [], set())
+
+        assert "You have 1 active vow(s)" in capsys.readouterr().out
+
+    def test_empty_session_prompts_to_begin(self, mock_state, capsys):
+        handle_guide(mock_state, [], set())
+        out = capsys.readouterr().out
+
+        assert "New session started!" in out
+        assert "Start by describing your current situation" in out
+
+    def test_session_with_entries_skips_new_session_hints(self, mock_state, capsys):
+        mock_state.session.add_journal("We land on the moon.")
+        handle_guide(mock_state, [], set())
+        out = capsys.readouterr().out
+
+        assert "New session started!" not in out
+        assert "Start by describing" not in out
+
+
+class TestGuideSteps:
+    @pytest.mark.parametrize("step", ["envision", "oracle", "move", "outcome"])
+    def test_each_step_opens_its_help_page(self, mock_state, step):
+        with patch("wyrd.commands.guide._show_step_help") as mock_help:
+            handle_guide(mock_state, [step.upper()], set())
+        mock_help.assert_called_once()
+        assert mock_help.call_args.args == (step, mock_state)
+
+    def test_counted_steps_pass_their_counts(self, mock_state):
+        mock_state.oracles = {"a": 1, "b": 2}
+        with patch("wyrd.commands.guide._show_step_help") as mock_help:
+            handle_guide(mock_state, ["oracle"], set())
+            handle_guide(mock_state, ["move"], set())
+        assert mock_help.call_args_list[0].kwargs == {"oracle_count": 2}
+        assert mock_help.call_args_list[1].kwargs == {"move_count": 1}
+
+    def test_step_counts_only_cover_known_steps(self):
+        from wyrd.commands.guide import _STEP_COUNTS, _STEPS
+
+        assert set(_STEP_COUNTS) <= _STEPS
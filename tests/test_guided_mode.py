@@ -1,6 +1,6 @@
 """Tests for guided mode functionality."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -137,3 +137,211 @@ class TestGuidedMode:
             assert mock_state.guided_phase == phases[i]
             advance_phase(mock_state)
         assert mock_state.guided_phase == "envision"  # Back to start
+
+
+class TestPhaseHelp:
+    """Normal phase help is rendered once per phase and printed in one call."""
+
+    @pytest.mark.parametrize("phase", ["envision", "oracle", "move", "outcome"])
+    def test_phase_help_prints_prebuilt_block(self, mock_state, phase):
+        from wyrd.commands.guided_mode import _render_phase_help, _show_phase_help
+
+        mock_state.guided_phase = phase
+        with patch("wyrd.commands.guided_mode.display.console.print") as mock_print:
+            _show_phase_help(mock_state)
+
+        mock_print.assert_called_once_with(_render_phase_help(phase))
+
+    def test_phase_help_mentions_phase(self, mock_state, capsys):
+        from wyrd.commands.guided_mode import _show_phase_help
+
+        mock_state.guided_phase = "move"
+        _show_phase_help(mock_state)
+
+        out = capsys.readouterr().out
+        assert "PHASE: MOVE" in out
+        assert "/move face danger" in out
+
+
+class TestSectorAdvance:
+    """The sector wizard steps forward once and finishes after the last step."""
+
+    def test_advances_to_next_sector_step(self, mock_state, capsys):
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "sector_settlements"
+        mock_state.sector_region = "terminus"
+        advance_phase(mock_state)
+
+        assert mock_state.guided_phase == "sector_planets"
+        assert "Step 3 of 11" in capsys.readouterr().out
+
+    def test_last_step_completes_wizard(self, mock_state, capsys):
+        from wyrd.commands.guided_mode import SECTOR_PHASES
+
+        mock_state.guided_mode = True
+        mock_state.guided_phase = SECTOR_PHASES[-1]
+        advance_phase(mock_state)
+
+        assert mock_state.guided_mode is False
+        assert mock_state.guided_phase == "envision"
+        assert "Sector Creation Complete" in capsys.readouterr().out
+
+
+class TestGuidedPromptHtml:
+    """prompt_toolkit prompts are built once per phase and reused."""
+
+    def test_same_phase_returns_same_prompt(self, mock_state):
+        from wyrd.commands.guided_mode import get_guided_prompt_html
+
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "oracle"
+        assert get_guided_prompt_html(mock_state) is get_guided_prompt_html(mock_state)
+
+    def test_prompt_shows_phase_in_its_colour(self, mock_state):
+        from wyrd.commands.guided_mode import get_guided_prompt_html
+
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "sector_map"
+        assert (
+            "<ansibrightyellow>[MAP]</ansibrightyellow>" in get_guided_prompt_html(mock_state).value
+        )
+
+    def test_unknown_phase_falls_back_to_white(self, mock_state):
+        from wyrd.commands.guided_mode import get_guided_prompt, get_guided_prompt_html
+
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "custom"
+        assert "<white>[CUSTOM]</white>" in get_guided_prompt_html(mock_state).value
+        assert get_guided_prompt(mock_state) == "[CUSTOM] > "
+
+    def test_not_guided_returns_plain_prompt(self, mock_state):
+        from wyrd.commands.guided_mode import get_guided_prompt_html
+
+        assert get_guided_prompt_html(mock_state).value == "> "
+
+
+class TestGuidedStartOutput:
+    """Starting guided mode reaches the terminal as one write."""
+
+    def test_normal_start_is_written_once(self, mock_state):
+        import io
+
+        from wyrd.ui import display
+
+        class Sink(io.StringIO):
+            writes = 0
+
+            def write(self, text: str) -> int:
+                Sink.writes += 1
+                return super().write(text)
+
+        with patch.object(display.console, "_file", Sink()):
+            start_guided_mode(mock_state)
+
+        assert Sink.writes == 1
+
+    def test_sector_intro_is_shown_before_region_prompt(self, mock_state, capsys):
+        seen: list[str] = []
+
+        def ask(*_args, **_kwargs):
+            seen.append(capsys.readouterr().out)
+            return "outlands"
+
+        with patch("rich.prompt.Prompt.ask", side_effect=ask):
+            start_guided_mode(mock_state, mode="sector")
+
+        assert "CHOOSE YOUR STARTING REGION" in seen[0]
+        assert mock_state.sector_region == "outlands"
+
+    def test_every_phase_has_a_prompt_colour(self):
+        from wyrd.commands.guided_mode import _PHASE_COLORS, SECTOR_PHASES
+
+        assert set(_PHASE_COLORS) == {"envision", "oracle", "move", "outcome", *SECTOR_PHASES}
+
+
+class TestStopGuidedMode:
+    def test_confirmed_stop_clears_wizard_state(self, mock_state):
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "sector_zoom"
+        mock_state.sector_region = "expanse"
+        with patch("rich.prompt.Confirm.ask", return_value=True):
+            stop_guided_mode(mock_state)
+
+        assert mock_state.guided_mode is False
+        assert mock_state.guided_phase == "envision"
+        assert mock_state.sector_region is None
+
+    def test_declined_stop_keeps_guided_mode(self, mock_state):
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "move"
+        with patch("rich.prompt.Confirm.ask", return_value=False):
+            stop_guided_mode(mock_state)
+
+        assert mock_state.guided_mode is True
+        assert mock_state.guided_phase == "move"
+
+
+class TestPhaseOutputFlush:
+    """Each /next reaches the terminal as one write followed by a flush."""
+
+    @pytest.mark.parametrize("phase", ["envision", "sector_settlements", "sector_name"])
+    def test_advance_writes_and_flushes_once(self, mock_state, phase):
+        import io
+
+        from wyrd.ui import display
+
+        class Sink(io.StringIO):
+            writes = 0
+            flushes = 0
+
+            def write(self, text: str) -> int:
+                Sink.writes += 1
+                return super().write(text)
+
+            def flush(self) -> None:
+                Sink.flushes += 1
+
+        mock_state.guided_mode = True
+        mock_state.guided_phase = phase
+        mock_state.sector_region = "terminus"
+        with patch.object(display.console, "_file", Sink()):
+            advance_phase(mock_state)
+
+        assert (Sink.writes, Sink.flushes) == (1, 1)
+
+
+class TestPhaseLabels:
+    def test_sector_labels_drop_prefix(self):
+        from wyrd.commands.guided_mode import _PHASE_LABELS
+
+        assert _PHASE_LABELS["sector_connection"] == "CONNECTION"
+        assert _PHASE_LABELS["oracle"] == "ORACLE"
+
+    def test_advance_announces_new_phase(self, mock_state, capsys):
+        mock_state.guided_mode = True
+        mock_state.guided_phase = "move"
+        advance_phase(mock_state)
+
+        assert "Advanced to: OUTCOME" in capsys.readouterr().out
+
+
+class TestPhaseHelpData:
+    def test_every_loop_phase_has_help(self):
+        from wyrd.commands.guided_mode import _NEXT_PHASE, _PHASE_HELP_DATA
+
+        assert set(_PHASE_HELP_DATA) == set(_NEXT_PHASE)
+
+    def test_oracle_help_lists_both_next_steps(self, mock_state, capsys):
+        from wyrd.commands.guided_mode import _show_phase_help
+
+        mock_state.guided_phase = "oracle"
+        _show_phase_help(mock_state)
+
+        out = capsys.readouterr().out
+        assert "to move to MOVE phase" in out
+        assert "now to skip if no questions" in out
+
+    def test_phase_help_is_rendered_once(self):
+        from wyrd.commands.guided_mode import _render_phase_help
+
+        assert _render_phase_help("move") is _render_phase_help("move")
@@ -219,3 +219,16 @@ class TestMoveCategoryCompletion:
         assert completion.display_meta
         meta_str = str(completion.display_meta)
         assert "category:combat" in meta_str or "combat" in meta_str
+
+    def test_categories_sorted_and_skip_uncategorized(self):
+        """Category suggestions come out sorted, with moves lacking a category ignored."""
+        completer = CommandCompleter(
+            moves={
+                "strike": {"name": "Strike", "category": "combat"},
+                "aid": {"name": "Aid Your Ally", "category": "adventure"},
+                "oddity": {"name": "Oddity"},
+            }
+        )
+        doc = Document("/move cat:", cursor_position=10)
+
+        assert [c.text for c in completer.get_completions(doc, None)] == ["adventure", "combat"]
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from wyrd.commands.move import (
     _apply_move_momentum,
     _choose_stat,
@@ -94,6 +96,50 @@ class TestFuzzyMatchMove:
         # face_danger (prefix) should come before defy_danger (substring)
         assert matches[0] == "face_danger"
 
+    def test_mutated_catalog_is_matched_fresh(self):
+        """Edits to the catalog are always seen."""
+        assert fuzzy_match_move("strike", self.moves) == ["strike"]
+
+        del self.moves["strike"]
+        self.moves["clash"] = {"name": "Clash"}
+        assert fuzzy_match_move("strike", self.moves) == []
+        assert fuzzy_match_move("clash", self.moves) == ["clash"]
+
+        self.moves["clash"]["name"] = "Strike Back"
+        assert fuzzy_match_move("strike", self.moves) == ["clash"]
+
+    def test_prefix_matches_keep_catalog_order(self):
+        """Prefix hits come back in catalog order, not alphabetical order."""
+        moves = {
+            "sojourn": {"name": "Sojourn"},
+            "secure_an_advantage": {"name": "Secure an Advantage"},
+            "set_a_course": {"name": "Set a Course"},
+        }
+        assert fuzzy_match_move("s", moves) == ["sojourn", "secure_an_advantage", "set_a_course"]
+
+    def test_prefix_on_key_and_name_lists_move_once(self):
+        """A move whose key and name both match a prefix is returned once."""
+        assert fuzzy_match_move("gath", self.moves) == ["gather_information"]
+
+    def test_exact_match_outside_category_falls_back_to_prefix(self):
+        """An exact hit filtered out by category leaves room for prefix hits."""
+        moves = {
+            "strike": {"name": "Strike", "category": "Combat"},
+            "strike_out": {"name": "Strike Out", "category": "Exploration"},
+        }
+        assert fuzzy_match_move("strike", moves, "exploration") == ["strike_out"]
+
+    def test_category_filter_is_case_insensitive(self):
+        """Category-only queries read the index bucket for the lowercased category."""
+        moves = {
+            "strike": {"name": "Strike", "category": "Combat"},
+            "sojourn": {"name": "Sojourn", "category": "Recover"},
+            "clash": {"name": "Clash", "category": "combat"},
+        }
+        assert fuzzy_match_move("", moves, "COMBAT") == ["strike", "clash"]
+        assert fuzzy_match_move("las", moves, "combat") == ["clash"]
+        assert fuzzy_match_move("", moves, "missing") == []
+
 
 class TestOutcomeText:
     """Tests for _outcome_text helper."""
@@ -229,6 +275,16 @@ class TestChooseStat:
 
         assert stat == "edge"
 
+    @patch("wyrd.commands.move.Prompt.ask")
+    @patch("wyrd.commands.move.display.info")
+    def test_choose_stat_prints_menu_in_one_call(self, mock_info, mock_prompt):
+        """The heading and every option go out in a single info line block."""
+        mock_prompt.return_value = "1"
+
+        _choose_stat(["edge", "iron"], self.state)
+
+        mock_info.assert_called_once_with("  Which stat?\n    [1] Edge     2\n    [2] Iron     3")
+
     @patch("wyrd.commands.move.Prompt.ask")
     @patch("wyrd.commands.move.display.info")
     @patch("wyrd.commands.move.display.error")
@@ -534,6 +590,31 @@ class TestHandleMoveMixedDiceMode:
         assert self.state.dice._force_physical is False
 
 
+class TestActionRollAdds:
+    """Tests for parsing the adds prompt of an action roll."""
+
+    def setup_method(self):
+        self.state = MagicMock()
+        self.state.character = Character(name="Test", stats=Stats(iron=3))
+        self.state.session = Session(number=1)
+        self.state.moves = {"strike": {"name": "Strike", "stat_options": ["iron"]}}
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("2", 2), (" 1 ", 1), ("+2", 2), ("-1", 0), ("abc", 0), ("", 0), ("++2", 0)],
+    )
+    @patch("wyrd.commands.move.roll_action_dice", return_value=(1, 9, 9))
+    @patch("wyrd.commands.move.Prompt.ask")
+    @patch("wyrd.commands.move.Confirm.ask", return_value=False)
+    @patch("wyrd.commands.move.display.move_result_panel")
+    def test_adds_parsing(self, mock_panel, _confirm, mock_prompt, _roll, raw, expected):
+        mock_prompt.side_effect = ["1", raw]
+
+        handle_move(self.state, ["strike"], set())
+
+        assert mock_panel.call_args.kwargs["result"].adds == expected
+
+
 class TestHandleNarrativeMove:
     """Tests for narrative/procedural moves without dice rolls."""
 
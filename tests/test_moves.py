@@ -66,6 +66,15 @@ class TestMomentumBurn:
     def test_would_momentum_improve_false_negative(self):
         assert would_momentum_improve(OutcomeTier.MISS, -2, 5, 8) is False
 
+    def test_would_momentum_improve_false_not_beating_either_die(self):
+        assert would_momentum_improve(OutcomeTier.MISS, 5, 5, 8) is False
+
+    def test_would_momentum_improve_true_beating_lower_die(self):
+        assert would_momentum_improve(OutcomeTier.MISS, 6, 5, 8) is True
+
+    def test_would_momentum_improve_false_same_tier(self):
+        assert would_momentum_improve(OutcomeTier.WEAK_HIT, 6, 5, 8) is False
+
 
 class TestResolveMove:
     def test_basic_strong_hit(self):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from wyrd.models.session import EntryKind, LogEntry, Session
 
 
@@ -44,6 +46,15 @@ class TestLogEntry:
         entry = LogEntry.from_dict(data)
         assert entry.player is None
 
+    def test_from_dict_returns_enum_member(self):
+        data = {"kind": "oracle", "text": "Roll", "timestamp": "2026-01-01T00:00:00"}
+        assert LogEntry.from_dict(data).kind is EntryKind.ORACLE
+
+    def test_from_dict_unknown_kind_raises_value_error(self):
+        data = {"kind": "shout", "text": "Roll", "timestamp": "2026-01-01T00:00:00"}
+        with pytest.raises(ValueError):
+            LogEntry.from_dict(data)
+
 
 class TestSession:
     def setup_method(self):
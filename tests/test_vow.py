@@ -43,6 +43,10 @@ class TestVow:
         assert restored.rank == vow.rank
         assert restored.ticks == vow.ticks
 
+    def test_from_dict_invalid_or_missing_rank_defaults_to_dangerous(self):
+        assert Vow.from_dict({"description": "x", "rank": "legendary"}).rank is VowRank.DANGEROUS
+        assert Vow.from_dict({"description": "x"}).rank is VowRank.DANGEROUS
+
 
 class TestFuzzyMatchVow:
     def setup_method(self):
@@ -64,3 +68,10 @@ class TestFuzzyMatchVow:
     def test_case_insensitive(self):
         results = fuzzy_match_vow("SIGNAL", self.vows)
         assert len(results) == 1
+
+    def test_matches_edited_description(self):
+        vow = self.vows[0]
+        fuzzy_match_vow("andurath", self.vows)
+        vow.description = "Rescue the Kaskadia crew"
+        assert fuzzy_match_vow("kaskadia", self.vows) == [vow]
+        assert fuzzy_match_vow("andurath", self.vows) == []
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import re
+import functools
 from typing import TYPE_CHECKING
 
 from rich.panel import Panel
 
-from wyrd.engine.assets import fuzzy_match_asset
+from wyrd.engine.assets import fuzzy_match_asset, group_assets_by_category
 from wyrd.models.asset import Asset, CharacterAsset
 from wyrd.ui import display
 from wyrd.ui.theme import BORDER_ASSET, FEEDBACK_ERROR
@@ -15,7 +15,21 @@ from wyrd.ui.theme import BORDER_ASSET, FEEDBACK_ERROR
 if TYPE_CHECKING:
     from wyrd.loop import GameState
 
-_DELTA_RE = re.compile(r"^[+-]?\d+$")
+
+# Spaces and hyphens both fold to "_" so "combat-bot" and "combat bot" match combat_bot
+_KEY_NORM = str.maketrans(" -", "__")
+
+
+@functools.lru_cache(maxsize=512)
+def _render_ability(text: str) -> str:
+    """Ability text as Rich markup; catalog text never changes, so render it once."""
+    return display.render_game_text(text)
+
+
+def _is_delta(arg: str) -> bool:
+    """True for an optionally signed integer such as '+2', '-1' or '3'."""
+    digits = arg[1:] if arg[:1] in ("+", "-") else arg
+    return digits.isdecimal()
 
 
 def handle_asset(state: GameState, args: list[str], _flags: set[str]) -> None:
@@ -64,30 +78,38 @@ def _find_char_asset(state: GameState, query: str) -> tuple[CharacterAsset, Asse
     Returns (CharacterAsset, Asset) on unique match, None if not found or ambiguous.
     """
     char = state.character
-    if not char or not char.assets:
+    owned = char.assets if char else None
+    if not owned:
         return None
+    catalog_get = state.assets.get
 
-    q = query.lower().replace(" ", "_").replace("-", "_")
+    q = query.lower().translate(_KEY_NORM)
 
-    exact: list[tuple[CharacterAsset, Asset]] = []
-    prefix: list[tuple[CharacterAsset, Asset]] = []
-    substring: list[tuple[CharacterAsset, Asset]] = []
+    # Single pass keeping only the best tier seen: 0 = exact, 1 = prefix, 2 = substring
+    best_tier = 3
+    matches: list[tuple[CharacterAsset, Asset]] = []
 
-    for ca in char.assets:
-        asset_def = state.assets.get(ca.asset_key)
+    for ca in owned:
+        asset_def = catalog_get(ca.asset_key)
         if asset_def is None:
             continue
         key = ca.asset_key.lower()
-        name_norm = asset_def.name.lower().replace(" ", "_")
+        name_norm = asset_def.name_norm
 
         if q in (key, name_norm):
-            exact.append((ca, asset_def))
-        elif key.startswith(q) or name_norm.startswith(q):
-            prefix.append((ca, asset_def))
-        elif q in key or q in name_norm:
-            substring.append((ca, asset_def))
+            tier = 0
+        elif best_tier > 0 and (key.startswith(q) or name_norm.startswith(q)):
+            tier = 1
+        elif best_tier > 1 and (q in key or q in name_norm):
+            tier = 2
+        else:
+            continue
 
-    matches = exact or prefix or substring
+        if tier < best_tier:
+            best_tier = tier
+            matches = [(ca, asset_def)]
+        elif tier == best_tier:
+            matches.append((ca, asset_def))
 
     if len(matches) == 1:
         return matches[0]
@@ -107,7 +129,7 @@ def _handle_asset_mutation(
     """Parse remaining args after the asset name and apply meter/condition change."""
     if len(remaining) == 1:
         arg = remaining[0]
-        if _DELTA_RE.match(arg):
+        if _is_delta(arg):
             # /asset [name] [+/-N] — primary meter
             _update_primary_meter(state, char_asset, asset_def, int(arg))
         else:
@@ -115,7 +137,7 @@ def _handle_asset_mutation(
             _toggle_asset_condition(state, char_asset, asset_def, arg)
     elif len(remaining) == 2:
         meter_name, delta_str = remaining
-        if not _DELTA_RE.match(delta_str):
+        if not _is_delta(delta_str):
             display.error(f"Expected a number for the delta, got '{delta_str}'.")
             return
         _update_named_meter(state, char_asset, asset_def, meter_name, int(delta_str))
@@ -142,11 +164,13 @@ def _update_named_meter(
 ) -> None:
     """Find a track by (partial) name, then apply delta."""
     q = meter_name.lower()
-    found = None
-    for tn in asset_def.tracks:
-        if tn == q or tn.startswith(q) or q in tn:
-            found = tn
-            break
+    tracks = asset_def.tracks
+    if q in tracks:
+        found: str | None = q
+    else:
+        found = next((tn for tn in tracks if tn.startswith(q)), None) or next(
+            (tn for tn in tracks if q in tn), None
+        )
 
     if found is None:
         available = ", ".join(asset_def.tracks.keys()) or "none"
@@ -183,20 +207,11 @@ def _list_assets(state: GameState) -> None:
         display.warn("No assets available.")
         return
 
-    # Group by category
-    categories: dict[str, list] = {}
-    for asset in state.assets.values():
-        cat = asset.category.replace("_", " ").title()
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(asset)
-
     display.console.print("\n[bold cyan]Available Assets[/bold cyan]")
     display.console.print("Use /asset [name] to view details (e.g., /asset starship)\n")
 
-    for category in sorted(categories.keys()):
-        asset_list = categories[category]
-        asset_names = ", ".join(sorted(a.name for a in asset_list))
+    grouped = state.assets_by_category or group_assets_by_category(state.assets)
+    for category, asset_names in grouped:
         display.console.print(f"[bold]{category}:[/bold] {asset_names}")
 
 
@@ -204,8 +219,7 @@ def _display_char_asset_details(char_asset: CharacterAsset, asset_def: Asset) ->
     """Display detailed asset info including live meter values and conditions."""
     lines = []
 
-    category = asset_def.category.replace("_", " ").title()
-    lines.append(f"[dim]Category: {category}[/dim]")
+    lines.append(f"[dim]Category: {asset_def.category_display}[/dim]")
 
     if asset_def.shared:
         lines.append("[dim]Shared Asset[/dim]")
@@ -239,9 +253,7 @@ def _display_char_asset_details(char_asset: CharacterAsset, asset_def: Asset) ->
         lines.append("[bold]Abilities:[/bold]")
         for i, ability in enumerate(asset_def.abilities, 1):
             enabled_marker = "●" if ability.enabled else "○"
-            lines.append(
-                f"  {enabled_marker} [dim]{i}.[/dim] {display.render_game_text(ability.text)}"
-            )
+            lines.append(f"  {enabled_marker} [dim]{i}.[/dim] {_render_ability(ability.text)}")
 
     body = "\n".join(lines)
     display.console.print(
@@ -265,8 +277,7 @@ def _display_asset_details(asset: Asset) -> None:
 
     lines = []
 
-    category = asset.category.replace("_", " ").title()
-    lines.append(f"[dim]Category: {category}[/dim]")
+    lines.append(f"[dim]Category: {asset.category_display}[/dim]")
 
     if asset.shared:
         lines.append("[dim]Shared Asset[/dim]")
@@ -286,9 +297,7 @@ def _display_asset_details(asset: Asset) -> None:
         lines.append("[bold]Abilities:[/bold]")
         for i, ability in enumerate(asset.abilities, 1):
             enabled_marker = "●" if ability.enabled else "○"
-            lines.append(
-                f"  {enabled_marker} [dim]{i}.[/dim] {display.render_game_text(ability.text)}"
-            )
+            lines.append(f"  {enabled_marker} [dim]{i}.[/dim] {_render_ability(ability.text)}")
 
     body = "\n".join(lines)
     display.console.print(
@@ -15,9 +15,8 @@ from wyrd.state.campaign import (
     campaign_path,
     create_campaign,
     join_campaign,
-    list_campaigns,
-    load_campaign,
     player_save_path,
+    scan_campaigns,
 )
 from wyrd.state.save import save_game
 from wyrd.sync import FileLogAdapter, LocalAdapter
@@ -25,9 +24,25 @@ from wyrd.ui import display
 from wyrd.ui.theme import BORDER_REFERENCE, COOP_TRUTH, HINT_COMMAND
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from wyrd.loop import GameState
 
-_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _campaign_table(rows: list[tuple[str, tuple[str, ...] | None]]) -> Table:
+    """Numbered picker table of campaigns and their players."""
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Slug")
+    table.add_column("Players")
+    for i, (slug, players) in enumerate(rows, 1):
+        if players is None:
+            table.add_row(str(i), slug, "[dim](unreadable)[/dim]")
+        else:
+            table.add_row(str(i), slug, ", ".join(players) or "(none)")
+    return table
 
 
 def handle_campaign(state: GameState, args: list[str], flags: set[str]) -> None:
@@ -43,21 +58,13 @@ def handle_campaign(state: GameState, args: list[str], flags: set[str]) -> None:
     """
     sub = args[0].lower() if args else ""
 
-    if sub == "start":
-        _handle_start(state)
-    elif sub == "create":
-        _handle_create(state)
-    elif sub == "join":
-        _handle_join(state)
-    elif sub == "status":
-        _handle_status(state)
-    elif sub == "leave":
-        _handle_leave(state)
+    handler = _SUBCOMMANDS.get(sub)
+    if handler is not None:
+        handler(state)
+    elif state.campaign is None:
+        _show_no_campaign_help()
     else:
-        if state.campaign is None:
-            _show_no_campaign_help()
-        else:
-            _handle_status(state)
+        _handle_status(state)
 
 
 # ---------------------------------------------------------------------------
@@ -145,28 +152,17 @@ def _handle_start_create_coop(state: GameState) -> None:
 
 def _handle_start_join_coop(state: GameState) -> None:
     """Join existing campaign: pick campaign → char creation (no truths) → save in players/."""
-    campaigns = list_campaigns()
-    if not campaigns:
+    rows = scan_campaigns()
+    if not rows:
         display.warn("No campaigns found. Use option 2 to create one first.")
         return
+    campaigns = [slug for slug, _players in rows]
+    campaign_set = frozenset(campaigns)
 
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Slug")
-    table.add_column("Players")
+    display.console.print(_campaign_table(rows))
 
-    for i, slug in enumerate(campaigns, 1):
-        try:
-            c = load_campaign(campaign_path(slug))
-            players = ", ".join(c.players.keys()) or "(none)"
-            table.add_row(str(i), slug, players)
-        except Exception:
-            table.add_row(str(i), slug, "[dim](unreadable)[/dim]")
-
-    display.console.print(table)
-
-    choice = Prompt.ask("Enter campaign number or slug")
-    if not choice.strip():
+    choice = Prompt.ask("Enter campaign number or slug").strip()
+    if not choice:
         return
 
     slug: str | None = None
@@ -175,7 +171,7 @@ def _handle_start_join_coop(state: GameState) -> None:
         if 0 <= idx < len(campaigns):
             slug = campaigns[idx]
     else:
-        slug = choice.strip() if choice.strip() in campaigns else None
+        slug = choice if choice in campaign_set else None
 
     if slug is None:
         display.error(f"Campaign '{choice}' not found.")
@@ -257,29 +253,18 @@ def _handle_join(state: GameState) -> None:
         )
         return
 
-    campaigns = list_campaigns()
-    if not campaigns:
+    rows = scan_campaigns()
+    if not rows:
         display.warn("No campaigns found. Use /campaign create to start one.")
         return
+    campaigns = [slug for slug, _players in rows]
+    campaign_set = frozenset(campaigns)
 
     # Show available campaigns
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Slug")
-    table.add_column("Players")
+    display.console.print(_campaign_table(rows))
 
-    for i, slug in enumerate(campaigns, 1):
-        try:
-            c = load_campaign(campaign_path(slug))
-            players = ", ".join(c.players.keys()) or "(none)"
-            table.add_row(str(i), slug, players)
-        except Exception:
-            table.add_row(str(i), slug, "[dim](unreadable)[/dim]")
-
-    display.console.print(table)
-
-    choice = Prompt.ask("Enter campaign number or slug")
-    if not choice.strip():
+    choice = Prompt.ask("Enter campaign number or slug").strip()
+    if not choice:
         return
 
     # Resolve selection
@@ -289,7 +274,7 @@ def _handle_join(state: GameState) -> None:
         if 0 <= idx < len(campaigns):
             slug = campaigns[idx]
     else:
-        slug = choice.strip() if choice.strip() in campaigns else None
+        slug = choice if choice in campaign_set else None
 
     if slug is None:
         display.error(f"Campaign '{choice}' not found.")
@@ -363,14 +348,26 @@ def _handle_leave(state: GameState) -> None:
     display.info(f"Left campaign '{name}'. Playing in solo mode.")
 
 
+_SUBCOMMANDS: dict[str, Callable[[GameState], None]] = {
+    "start": _handle_start,
+    "create": _handle_create,
+    "join": _handle_join,
+    "status": _handle_status,
+    "leave": _handle_leave,
+}
+
+
+# Theme colours are fixed at import, so the help text is built once
+_NO_CAMPAIGN_HELP = (
+    "[bold]Co-op Campaign Mode[/bold]\n\n"
+    "You are currently playing solo. Start or join a campaign to play with others.\n\n"
+    f"  [{HINT_COMMAND}]/campaign start[/{HINT_COMMAND}]   — begin your adventure (solo, create co-op, or join)\n"
+    f"  [{HINT_COMMAND}]/campaign create[/{HINT_COMMAND}]  — create a new campaign (you become the first player)\n"
+    f"  [{HINT_COMMAND}]/campaign join[/{HINT_COMMAND}]    — join an existing campaign\n\n"
+    "Campaign files are shared via a common directory (Dropbox, Syncthing, etc.).\n"
+    "Each player keeps their own character save; events sync via JSONL log files."
+)
+
+
 def _show_no_campaign_help() -> None:
-    content = (
-        "[bold]Co-op Campaign Mode[/bold]\n\n"
-        "You are currently playing solo. Start or join a campaign to play with others.\n\n"
-        f"  [{HINT_COMMAND}]/campaign start[/{HINT_COMMAND}]   — begin your adventure (solo, create co-op, or join)\n"
-        f"  [{HINT_COMMAND}]/campaign create[/{HINT_COMMAND}]  — create a new campaign (you become the first player)\n"
-        f"  [{HINT_COMMAND}]/campaign join[/{HINT_COMMAND}]    — join an existing campaign\n\n"
-        "Campaign files are shared via a common directory (Dropbox, Syncthing, etc.).\n"
-        "Each player keeps their own character save; events sync via JSONL log files."
-    )
-    display.console.print(Panel(content, border_style=BORDER_REFERENCE, padding=(1, 2)))
+    display.console.print(Panel(_NO_CAMPAIGN_HELP, border_style=BORDER_REFERENCE, padding=(1, 2)))
@@ -57,10 +57,11 @@ def _handle_char_new(state: GameState) -> None:
     display.success(f"Character created: {character.name}. Switching to them now.")
 
 
+@display.batched()
 def handle_track(state: GameState, track: str, args: list[str]) -> None:
     """Handle /health, /spirit, /supply with +N or -N."""
     if not args:
-        val = getattr(state.character, track)
+        val = state.character.get_track(track)
         display.info(f"  {track.capitalize()}: {val}/5")
         return
 
@@ -76,6 +77,7 @@ def handle_track(state: GameState, track: str, args: list[str]) -> None:
     state.session.add_mechanical(f"{track.capitalize()} {delta:+d} (now {new_val}/5)")
 
 
+@display.batched()
 def handle_momentum(state: GameState, args: list[str], flags: set[str]) -> None:
     if not args:
         display.info(f"  Momentum: {state.character.momentum:+d}")
@@ -93,6 +95,7 @@ def handle_momentum(state: GameState, args: list[str], flags: set[str]) -> None:
     state.session.add_mechanical(f"Momentum {delta:+d} (now {new_val:+d})")
 
 
+@display.batched()
 def handle_settings(state: GameState, args: list[str], flags: set[str]) -> None:
     if not args:
         from wyrd.config import config
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+from bisect import bisect_left
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from prompt_toolkit.completion import Completer, Completion
@@ -15,8 +19,134 @@ from wyrd.commands.registry import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from wyrd.engine.oracles import OracleTable
 
+# (option, description, lowercased option) sorted by option, for _complete_options
+_GUIDE_OPTIONS = tuple((k, v, k.lower()) for k, v in sorted(GUIDE_SUBCOMMANDS.items()))
+_TRUTHS_OPTIONS = tuple((k, v, k.lower()) for k, v in sorted(TRUTHS_SUBCOMMANDS.items()))
+
+# Trie node key holding (command, meta) for a complete command; never a real character
+_TERMINAL = ""
+
+
+def _build_trie(entries: Iterable[tuple[str, str]]) -> dict:
+    """Nested-dict trie over lowercased commands.
+
+    Entries are inserted in sorted order, so every node's children (and its
+    terminal, which sorts before any longer command) iterate alphabetically.
+    """
+    root: dict = {}
+    for cmd, meta in sorted(entries, key=lambda e: e[0].lower()):
+        node = root
+        for ch in cmd.lower():
+            node = node.setdefault(ch, {})
+        node[_TERMINAL] = (cmd, meta)
+    return root
+
+
+# (key, display name, matchable key, matchable name) — see CommandCompleter._index_entry
+_IndexEntry = tuple[str, str, str, str]
+
+
+class _MatchIndex:
+    """Key-sorted completion entries with a trigram substring index."""
+
+    __slots__ = ("_trigrams", "entries")
+
+    # Entries must be sorted by key: search yields in entry order, which is display order
+
+    def __init__(self, entries: list[_IndexEntry]) -> None:
+        self.entries = entries
+        # Each character trigram of the matchable key/name -> ids of entries containing it
+        postings: defaultdict[str, set[int]] = defaultdict(set)
+        for i, (_key, _name, key_match, name_match) in enumerate(entries):
+            for text in (key_match, name_match):
+                for j in range(len(text) - 2):
+                    postings[text[j : j + 3]].add(i)
+        self._trigrams = {gram: frozenset(ids) for gram, ids in postings.items()}
+
+    def search(self, arg: str) -> Iterator[_IndexEntry]:
+        """Yield entries containing arg in their key or name, in key order."""
+        entries = self.entries
+        if not arg:
+            yield from entries
+            return
+
+        for i in self._substring_candidates(arg):
+            entry = entries[i]
+            if arg in entry[2] or arg in entry[3]:
+                yield entry
+
+    def _substring_candidates(self, arg: str) -> Iterable[int]:
+        """Ids that may contain arg, in entry order; callers still verify the substring.
+
+        Any entry containing arg holds all of arg's trigrams, so intersecting their
+        postings narrows the scan without dropping matches. Args shorter than a
+        trigram scan everything.
+        """
+        if len(arg) < 3:
+            return range(len(self.entries))
+        ids: frozenset[int] | None = None
+        for j in range(len(arg) - 2):
+            posting = self._trigrams.get(arg[j : j + 3])
+            if not posting:
+                return ()
+            ids = posting if ids is None else ids & posting
+            if not ids:
+                return ()
+        return sorted(ids or ())
+
+
+def _iter_trie(node: dict) -> Iterator[tuple[str, str]]:
+    """Yield every (command, meta) under node in alphabetical order."""
+    for key, child in node.items():
+        if key == _TERMINAL:
+            yield child
+        else:
+            yield from _iter_trie(child)
+
+
+@functools.cache
+def _full_command_entries() -> tuple[tuple[str, str], ...]:
+    """(/command, short description) for every full command name."""
+    entries: list[tuple[str, str]] = []
+    for cmd, help_text in COMMAND_HELP.items():
+        # Short description is everything after '—'
+        _usage, sep, description = help_text.partition("—")
+        entries.append((f"/{cmd}", description.strip() if sep else ""))
+    return tuple(entries)
+
+
+@functools.cache
+def _alias_entries() -> tuple[tuple[str, str], ...]:
+    """(/alias, "alias for /target") per alias, sorted by lowercased alias for bisect."""
+    return tuple(
+        sorted(
+            ((f"/{alias}", f"alias for /{target}") for alias, target in COMMAND_ALIASES.items()),
+            key=lambda e: e[0].lower(),
+        )
+    )
+
+
+@functools.cache
+def _command_entries() -> tuple[tuple[str, str], ...]:
+    """Every full command followed by every alias, as (/name, meta) pairs."""
+    return _full_command_entries() + _alias_entries()
+
+
+@functools.cache
+def _command_trie() -> dict:
+    """Shared, read-only trie over full command names; aliases are matched separately."""
+    return _build_trie(_full_command_entries())
+
+
+@functools.cache
+def _alias_keys() -> tuple[str, ...]:
+    """Lowercased aliases, parallel to _alias_entries(), for bisect prefix lookups."""
+    return tuple(alias.lower() for alias, _meta in _alias_entries())
+
 
 class CommandCompleter(Completer):
     """Completer for /commands with support for aliases, oracle tables, moves, and assets."""
@@ -27,70 +157,130 @@ class CommandCompleter(Completer):
         moves: dict | None = None,
         assets: dict | None = None,
     ) -> None:
-        # Build list of all commands (full names + aliases)
-        self.commands: list[str] = []
-        self.command_meta: dict[str, str] = {}
+        # All commands (full names + aliases), parsed once per process
+        entries = _command_entries()
+        self.commands: tuple[str, ...] = tuple(cmd for cmd, _meta in entries)
+        self.command_meta: dict[str, str] = dict(entries)
+        # Setters below build the argument indexes; catalogs are read-only once loaded
         self.oracles = oracles or {}
         self.moves = moves or {}
         self.assets = assets or {}
 
-        # Add full command names with descriptions
-        for cmd, help_text in COMMAND_HELP.items():
-            self.commands.append(f"/{cmd}")
-            # Extract short description from help text (everything after '—')
-            if "—" in help_text:
-                self.command_meta[f"/{cmd}"] = help_text.split("—", 1)[1].strip()
-            else:
-                self.command_meta[f"/{cmd}"] = ""
-
-        # Add aliases with their target command
-        for alias, target in COMMAND_ALIASES.items():
-            self.commands.append(f"/{alias}")
-            self.command_meta[f"/{alias}"] = f"alias for /{target}"
-
-    def get_completions(self, document: Document, complete_event: object) -> list[Completion]:
-        """Return completions for the current input."""
+        self._command_trie = _command_trie()
+        # Completions per typed command prefix; start_position depends on the
+        # prefix, so Completion objects can only be shared for identical input.
+        self._command_completions: dict[str, tuple[Completion, ...]] = {}
+
+    # ── Catalogs ───────────────────────────────────────────────────────────────
+    # Indexes are sorted by key once, so helpers can yield matches in display order.
+    # Oracle names match case-insensitively; moves/assets also ignore separators.
+
+    @property
+    def oracles(self) -> dict[str, OracleTable]:
+        return self._oracles
+
+    @oracles.setter
+    def oracles(self, oracles: dict[str, OracleTable]) -> None:
+        self._oracles = oracles
+        self._oracle_index = _MatchIndex(
+            [
+                (key, table.name, key.lower(), table.name.lower())
+                for key, table in sorted(oracles.items())
+            ]
+        )
+
+    @property
+    def moves(self) -> dict:
+        return self._moves
+
+    @moves.setter
+    def moves(self, moves: dict) -> None:
+        self._moves = moves
+        self._move_index = _MatchIndex(
+            [
+                self._index_entry(key, move_data.get("name", ""))
+                for key, move_data in sorted(moves.items())
+            ]
+        )
+        # (category, lowercased category) for the category: filter, sorted
+        self._move_categories = tuple(
+            (cat, cat.lower())
+            for cat in sorted({move_data.get("category", "") for move_data in moves.values()})
+            if cat
+        )
+
+    @property
+    def assets(self) -> dict:
+        return self._assets
+
+    @assets.setter
+    def assets(self, assets: dict) -> None:
+        self._assets = assets
+        self._asset_index = _MatchIndex(
+            [
+                self._index_entry(key, getattr(asset, "name", key))
+                for key, asset in sorted(assets.items())
+            ]
+        )
+
+    def get_completions(self, document: Document, complete_event: object) -> Iterator[Completion]:
+        """Yield completions for the current input."""
         text = document.text_before_cursor
 
         # Only complete if we're typing a command (starts with /)
         if not text.startswith("/"):
-            return []
+            return
 
         # Check if we're completing arguments after a command
         if " " in text:
-            return self._complete_arguments(text)
-
-        # Complete the command itself
-        return self._complete_command(text)
-
-    def _complete_command(self, text: str) -> list[Completion]:
-        """Complete slash command names."""
-        completions = []
-        for cmd in self.commands:
-            if cmd.startswith(text.lower()):
-                # Calculate how many characters to complete
-                # Use text (not word) to include the leading /
-                start_position = -len(text)
-                completions.append(
-                    Completion(
-                        text=cmd,
-                        start_position=start_position,
-                        display_meta=self.command_meta.get(cmd, ""),
-                    )
-                )
-        return sorted(completions, key=lambda c: c.text)
-
-    def _complete_arguments(self, text: str) -> list[Completion]:
+            yield from self._complete_arguments(text)
+        else:
+            # Complete the command itself
+            yield from self._complete_command(text)
+
+    def _complete_command(self, text: str) -> Iterable[Completion]:
+        """Complete slash command names from the full-name trie and the alias table."""
+        cached = self._command_completions.get(text)
+        if cached is None:
+            text_lower = text.lower()
+
+            node: dict | None = self._command_trie
+            for ch in text_lower:
+                node = node.get(ch)
+                if node is None:
+                    break
+            full = _iter_trie(node) if node is not None else ()
+
+            alias_keys = _alias_keys()
+            lo = bisect_left(alias_keys, text_lower)
+            hi = bisect_left(alias_keys, text_lower + "\U0010ffff")
+            aliases = _alias_entries()[lo:hi]
+
+            # Both sources are sorted, so merging keeps the list alphabetical; a
+            # complete alias such as /o sorts ahead of every name it prefixes.
+            matches = list(heapq.merge(full, aliases, key=lambda e: e[0].lower()))
+            if not matches:
+                return ()
+
+            # Use text (not word) to include the leading /
+            start_position = -len(text)
+            cached = self._command_completions[text] = tuple(
+                Completion(text=cmd, start_position=start_position, display_meta=meta)
+                for cmd, meta in matches
+            )
+        return cached
+
+    def _complete_arguments(self, text: str) -> Iterable[Completion]:
         """Complete arguments for specific commands."""
         # Parse out the command and current argument
         parts = text.split()
         if not parts:
-            return []
+            return ()
 
         command = parts[0].lower()
 
         # Get the current partial argument being typed
-        current_arg = text.split()[-1] if not text.endswith(" ") else ""
+        current_arg = "" if text.endswith(" ") else parts[-1]
 
         # Complete oracle tables
         if command in ["/oracle", "/o"]:
@@ -112,7 +302,7 @@ class CommandCompleter(Completer):
         if command == "/truths":
             return self._complete_truths_args(current_arg)
 
-        return []
+        return ()
 
     # ── Private helpers ────────────────────────────────────────────────────────
 
@@ -121,6 +311,11 @@ class CommandCompleter(Completer):
         """Lowercase and replace separators for fuzzy matching."""
         return text.lower().replace("_", " ").replace("-", " ")
 
+    @classmethod
+    def _index_entry(cls, key: str, name: str) -> _IndexEntry:
+        """Pair a key and display name with their normalized forms for matching."""
+        return key, name, cls._normalize(key), cls._normalize(name)
+
     @staticmethod
     def _make_completion(text: str, display_meta: str, current_arg: str) -> Completion:
         """Build a single Completion with correct start position."""
@@ -130,74 +325,51 @@ class CommandCompleter(Completer):
             display_meta=display_meta,
         )
 
-    def _complete_options(self, current_arg: str, options: dict[str, str]) -> list[Completion]:
-        """Complete from a fixed dict of {option: description} pairs."""
-        completions = [
-            self._make_completion(option, description, current_arg)
-            for option, description in options.items()
-            if not current_arg or current_arg.lower() in option.lower()
-        ]
-        return sorted(completions, key=lambda c: c.text)
+    def _complete_options(
+        self, current_arg: str, options: Iterable[tuple[str, str, str]]
+    ) -> Iterator[Completion]:
+        """Complete from sorted (option, description, lowercased option) triples."""
+        arg = current_arg.lower()
+        for option, description, option_lower in options:
+            if arg in option_lower:
+                yield self._make_completion(option, description, current_arg)
+
+    @staticmethod
+    def _scan_indexed(index: _MatchIndex, arg: str, current_arg: str) -> Iterator[Completion]:
+        """Yield a Completion per index entry matching the already-normalized arg."""
+        start_position = -len(current_arg)
+        for key, name, _key_match, _name_match in index.search(arg):
+            yield Completion(text=key, start_position=start_position, display_meta=name)
 
-    def _complete_oracle_tables(self, current_arg: str) -> list[Completion]:
+    def _complete_oracle_tables(self, current_arg: str) -> Iterator[Completion]:
         """Complete oracle table names."""
-        arg = current_arg.lower()
-        completions = [
-            self._make_completion(key, table.name, current_arg)
-            for key, table in self.oracles.items()
-            if not current_arg or arg in key.lower() or arg in table.name.lower()
-        ]
-        return sorted(completions, key=lambda c: c.text)
-
-    def _complete_moves(self, current_arg: str) -> list[Completion]:
+        return self._scan_indexed(self._oracle_index, current_arg.lower(), current_arg)
+
+    def _complete_moves(self, current_arg: str) -> Iterator[Completion]:
         """Complete move names and category filters."""
         if ":" in current_arg:
             prefix, partial_value = current_arg.split(":", 1)
             if prefix.lower() in ("category", "type", "cat"):
-                return self._complete_move_categories(partial_value, prefix)
-
-        arg_norm = self._normalize(current_arg)
-        completions = [
-            self._make_completion(key, move_data.get("name", ""), current_arg)
-            for key, move_data in self.moves.items()
-            if not current_arg
-            or arg_norm in self._normalize(key)
-            or arg_norm in self._normalize(move_data.get("name", ""))
-        ]
-        return sorted(completions, key=lambda c: c.text)
-
-    def _complete_move_categories(self, partial_value: str, prefix: str) -> list[Completion]:
+                yield from self._complete_move_categories(partial_value, prefix)
+                return
+
+        yield from self._scan_indexed(self._move_index, self._normalize(current_arg), current_arg)
+
+    def _complete_move_categories(self, partial_value: str, prefix: str) -> Iterator[Completion]:
         """Complete category names for the category: filter syntax."""
-        categories = sorted(
-            {move_data.get("category", "") for move_data in self.moves.values()} - {""}
-        )
-        completions = [
-            self._make_completion(cat, f"{prefix}:{cat}", partial_value)
-            for cat in categories
-            if not partial_value or partial_value.lower() in cat.lower()
-        ]
-        return sorted(completions, key=lambda c: c.text)
-
-    def _complete_assets(self, current_arg: str) -> list[Completion]:
+        value = partial_value.lower()
+        for cat, cat_lower in self._move_categories:
+            if value in cat_lower:
+                yield self._make_completion(cat, f"{prefix}:{cat}", partial_value)
+
+    def _complete_assets(self, current_arg: str) -> Iterator[Completion]:
         """Complete asset names."""
-        arg_norm = self._normalize(current_arg)
-        completions = [
-            self._make_completion(
-                key,
-                asset.name if hasattr(asset, "name") else key,
-                current_arg,
-            )
-            for key, asset in self.assets.items()
-            if not current_arg
-            or arg_norm in self._normalize(key)
-            or arg_norm in self._normalize(asset.name if hasattr(asset, "name") else key)
-        ]
-        return sorted(completions, key=lambda c: c.text)
-
-    def _complete_guide_args(self, current_arg: str) -> list[Completion]:
+        return self._scan_indexed(self._asset_index, self._normalize(current_arg), current_arg)
+
+    def _complete_guide_args(self, current_arg: str) -> Iterator[Completion]:
         """Complete guide arguments (commands and steps)."""
-        return self._complete_options(current_arg, GUIDE_SUBCOMMANDS)
+        return self._complete_options(current_arg, _GUIDE_OPTIONS)
 
-    def _complete_truths_args(self, current_arg: str) -> list[Completion]:
+    def _complete_truths_args(self, current_arg: str) -> Iterator[Completion]:
         """Complete truths subcommands."""
-        return self._complete_options(current_arg, TRUTHS_SUBCOMMANDS)
+        return self._complete_options(current_arg, _TRUTHS_OPTIONS)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import tomllib
+import functools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,17 +22,116 @@ from wyrd.ui.theme import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from wyrd.loop import GameState
 
-_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Steps with a guide.toml help page ("sector" is dispatched separately)
+_STEPS: frozenset[str] = frozenset({"envision", "oracle", "move", "outcome"})
 
 
+@functools.cache
 def _load_guide_prose() -> dict[str, dict[str, str]]:
+    """Parse guide.toml on first use; most sessions never open a step page."""
+    import tomllib
+
     with open(_DATA_DIR / "guide.toml", "rb") as f:
         return tomllib.load(f)
 
 
-_GUIDE = _load_guide_prose()
+# ── Static overview ─────────────────────────────────────────────────────────────
+# The flowchart and footer never depend on game state, so their markup is parsed
+# once at import rather than on every /guide.
+
+_LOOP_MARKUP = "\n".join(
+    [
+        "",
+        f"  [bold {HINT_COMMAND}]START[/bold {HINT_COMMAND}]",
+        "    |",
+        "    v",
+        "",
+        "  [bold]1. ENVISION[/bold] the current situation",
+        "     [dim]Write what your character is doing[/dim]",
+        f"     [{HINT_COMMAND}]> Type narrative text (no / prefix)[/{HINT_COMMAND}]",
+        "",
+        "     <-->",
+        "",
+        "  [bold]2. ASK THE ORACLE[/bold] when uncertain",
+        "     [dim]Get answers about the situation, location, NPCs[/dim]",
+        f"     [{HINT_COMMAND}]> /oracle [[table]] (e.g., /oracle action theme)[/{HINT_COMMAND}]",
+        "",
+        "    |",
+        "    v",
+        "",
+        "  [bold]3. MAKE A MOVE[/bold] when action triggers it",
+        "     [dim]Roll dice to resolve risky actions[/dim]",
+        f"     [{HINT_COMMAND}]> /move [[name]] (e.g., /move face danger)[/{HINT_COMMAND}]",
+        "",
+        "    |",
+        "    v",
+        "",
+        # Outcomes section with color coding
+        "  [bold]OUTCOMES:[/bold]",
+        "",
+        f"    [{OUTCOME_STRONG}]STRONG HIT[/{OUTCOME_STRONG}] [{OUTCOME_STRONG}][[OK OK]][/{OUTCOME_STRONG}]",
+        "      You succeeded and are in control",
+        "      > What do [bold]you[/bold] do next?",
+        "",
+        f"    [{OUTCOME_WEAK}]WEAK HIT[/{OUTCOME_WEAK}] [{OUTCOME_WEAK}][[OK NO]][/{OUTCOME_WEAK}]",
+        "      You succeeded with a lesser result or cost",
+        "      > What [bold]happens[/bold] next?",
+        "",
+        f"    [{OUTCOME_MISS}]MISS[/{OUTCOME_MISS}] [{OUTCOME_MISS}][[NO NO]][/{OUTCOME_MISS}]",
+        "      You failed or face a dramatic turn of events",
+        "      > What [bold]happens[/bold] next?",
+        "",
+        "  [dim]> Loop back to step 1 (Envision)[/dim]",
+        "",
+    ]
+)
+
+_FOOTER_MARKUP = "\n".join(
+    [
+        "",
+        "  [dim]For detailed help on each step:[/dim]",
+        f"    [{HINT_COMMAND}]/guide envision[/{HINT_COMMAND}]  — Learn about envisioning",
+        f"    [{HINT_COMMAND}]/guide oracle[/{HINT_COMMAND}]    — Learn about oracles",
+        f"    [{HINT_COMMAND}]/guide move[/{HINT_COMMAND}]      — Learn about moves",
+        f"    [{HINT_COMMAND}]/guide outcome[/{HINT_COMMAND}]   — Learn about outcomes",
+        f"    [{HINT_COMMAND}]/guide sector[/{HINT_COMMAND}]    — Build a starting sector (pp. 114–126)",
+        "",
+    ]
+)
+
+
+# ── Suggestion fragments ────────────────────────────────────────────────────────
+# Themed markup for each suggestion, interpolated once rather than per /guide.
+
+_SUGGESTIONS_HEADER = "  [bold]SUGGESTIONS FOR YOU RIGHT NOW:[/bold]\n"
+_NO_VOWS = (
+    f"    • [{FEEDBACK_WARN}]You have no active vows[/{FEEDBACK_WARN}]\n"
+    f"      Consider: [{HINT_COMMAND}]/vow [[rank]] [[description]][/{HINT_COMMAND}]"
+)
+_DESCRIBE_SITUATION = "      [dim]Start by describing your current situation[/dim]"
+_HEALTH_LOW = (
+    f"    • [{FEEDBACK_ERROR}]Your health is low[/{FEEDBACK_ERROR}]\n"
+    f"      Consider: [{HINT_COMMAND}]/move heal[/{HINT_COMMAND}]"
+    f" or [{HINT_COMMAND}]/move resupply[/{HINT_COMMAND}]"
+)
+_MOMENTUM_LOW = (
+    f"    • [{FEEDBACK_WARN}]Your momentum is low[/{FEEDBACK_WARN}]\n"
+    "      Consider making moves to gain momentum"
+)
+_SUPPLY_LOW = (
+    f"    • [{FEEDBACK_WARN}]Your supplies are running low[/{FEEDBACK_WARN}]\n"
+    f"      Consider: [{HINT_COMMAND}]/move resupply[/{HINT_COMMAND}]"
+)
+_NEW_SESSION = (
+    f"\n    [{FEEDBACK_SUCCESS}]New session started![/{FEEDBACK_SUCCESS}]\n"
+    "    [dim]Begin by describing where you are and what you're doing[/dim]"
+)
 
 
 def handle_guide(state: GameState, args: list[str], flags: set[str]) -> None:
@@ -45,195 +144,98 @@ def handle_guide(state: GameState, args: list[str], flags: set[str]) -> None:
         /guide start - Enter guided mode (step-by-step wizard)
         /guide stop - Exit guided mode
     """
-    if args and args[0].lower() == "start":
-        start_guided_mode(state)
-        return
+    sub = args[0].lower() if args else ""
+
+    action = _ACTIONS.get(sub)
+    if action is not None:
+        action(state, args)
+    elif sub in _STEPS:
+        counts = _STEP_COUNTS.get(sub)
+        _show_step_help(sub, state, **(counts(state) if counts else {}))
+    else:
+        _show_game_loop(state)
 
-    if len(args) >= 2 and args[0].lower() == "sector" and args[1].lower() == "start":
-        start_guided_mode(state, mode="sector")
-        return
 
-    if args and args[0].lower() == "stop":
-        stop_guided_mode(state)
-        return
+def _handle_sector(state: GameState, args: list[str]) -> None:
+    """/guide sector start runs the sector wizard; plain /guide sector shows its help."""
+    if len(args) >= 2 and args[1].lower() == "start":
+        start_guided_mode(state, mode="sector")
+    else:
+        _show_step_help("sector", state)
 
-    if args and args[0].lower() in ["envision", "oracle", "move", "outcome", "sector"]:
-        _show_step_detail(args[0].lower(), state)
-        return
 
-    _show_game_loop(state)
+_ACTIONS: dict[str, Callable[[GameState, list[str]], None]] = {
+    "start": lambda state, _args: start_guided_mode(state),
+    "stop": lambda state, _args: stop_guided_mode(state),
+    "sector": _handle_sector,
+}
 
 
+@display.batched()
 def _show_game_loop(state: GameState) -> None:
     """Display the complete game loop overview."""
     display.rule("Ironsworn: Starforged Game Loop")
-    display.console.print()
 
-    # The game loop flowchart
-    display.console.print(f"  [bold {HINT_COMMAND}]START[/bold {HINT_COMMAND}]")
-    display.console.print("    |")
-    display.console.print("    v")
-    display.console.print()
-
-    display.console.print("  [bold]1. ENVISION[/bold] the current situation")
-    display.console.print("     [dim]Write what your character is doing[/dim]")
-    display.console.print(
-        f"     [{HINT_COMMAND}]> Type narrative text (no / prefix)[/{HINT_COMMAND}]"
-    )
-    display.console.print()
-    display.console.print("     <-->")
-    display.console.print()
-    display.console.print("  [bold]2. ASK THE ORACLE[/bold] when uncertain")
-    display.console.print("     [dim]Get answers about the situation, location, NPCs[/dim]")
-    display.console.print(
-        f"     [{HINT_COMMAND}]> /oracle [[table]] (e.g., /oracle action theme)[/{HINT_COMMAND}]"
-    )
-    display.console.print()
-    display.console.print("    |")
-    display.console.print("    v")
-    display.console.print()
-    display.console.print("  [bold]3. MAKE A MOVE[/bold] when action triggers it")
-    display.console.print("     [dim]Roll dice to resolve risky actions[/dim]")
-    display.console.print(
-        f"     [{HINT_COMMAND}]> /move [[name]] (e.g., /move face danger)[/{HINT_COMMAND}]"
-    )
-    display.console.print()
-    display.console.print("    |")
-    display.console.print("    v")
-    display.console.print()
-
-    # Outcomes section with color coding
-    display.console.print("  [bold]OUTCOMES:[/bold]")
-    display.console.print()
-    display.console.print(
-        f"    [{OUTCOME_STRONG}]STRONG HIT[/{OUTCOME_STRONG}] [{OUTCOME_STRONG}][[OK OK]][/{OUTCOME_STRONG}]"
-    )
-    display.console.print("      You succeeded and are in control")
-    display.console.print("      > What do [bold]you[/bold] do next?")
-    display.console.print()
-    display.console.print(
-        f"    [{OUTCOME_WEAK}]WEAK HIT[/{OUTCOME_WEAK}] [{OUTCOME_WEAK}][[OK NO]][/{OUTCOME_WEAK}]"
-    )
-    display.console.print("      You succeeded with a lesser result or cost")
-    display.console.print("      > What [bold]happens[/bold] next?")
-    display.console.print()
-    display.console.print(
-        f"    [{OUTCOME_MISS}]MISS[/{OUTCOME_MISS}] [{OUTCOME_MISS}][[NO NO]][/{OUTCOME_MISS}]"
-    )
-    display.console.print("      You failed or face a dramatic turn of events")
-    display.console.print("      > What [bold]happens[/bold] next?")
-    display.console.print()
-    display.console.print("  [dim]> Loop back to step 1 (Envision)[/dim]")
-    display.console.print()
+    display.console.print(display.static_text(_LOOP_MARKUP))
     display.rule()
     display.console.print()
 
     # Contextual suggestions based on game state
     _show_contextual_suggestions(state)
 
-    display.console.print()
-    display.console.print("  [dim]For detailed help on each step:[/dim]")
-    display.console.print(
-        f"    [{HINT_COMMAND}]/guide envision[/{HINT_COMMAND}]  — Learn about envisioning"
-    )
-    display.console.print(
-        f"    [{HINT_COMMAND}]/guide oracle[/{HINT_COMMAND}]    — Learn about oracles"
-    )
-    display.console.print(
-        f"    [{HINT_COMMAND}]/guide move[/{HINT_COMMAND}]      — Learn about moves"
-    )
-    display.console.print(
-        f"    [{HINT_COMMAND}]/guide outcome[/{HINT_COMMAND}]   — Learn about outcomes"
-    )
-    display.console.print(
-        f"    [{HINT_COMMAND}]/guide sector[/{HINT_COMMAND}]    — Build a starting sector (pp. 114–126)"
-    )
-    display.console.print()
+    display.console.print(display.static_text(_FOOTER_MARKUP))
 
 
 def _show_contextual_suggestions(state: GameState) -> None:
     """Show suggestions based on current game state."""
-    display.console.print("  [bold]SUGGESTIONS FOR YOU RIGHT NOW:[/bold]")
-    display.console.print()
+    character = state.character
+    entries_empty = not state.session.entries
+    active_vows = sum(1 for v in state.vows if not v.fulfilled)
 
-    # Check if there are active vows
-    active_vows = [v for v in state.vows if not v.fulfilled]
+    lines = [_SUGGESTIONS_HEADER]
 
     if not active_vows:
-        display.console.print(f"    • [{FEEDBACK_WARN}]You have no active vows[/{FEEDBACK_WARN}]")
-        display.console.print(
-            f"      Consider: [{HINT_COMMAND}]/vow [[rank]] [[description]][/{HINT_COMMAND}]"
-        )
+        lines.append(_NO_VOWS)
     else:
-        display.console.print(f"    • You have {len(active_vows)} active vow(s)")
-        if len(state.session.entries) == 0:
-            display.console.print("      [dim]Start by describing your current situation[/dim]")
+        lines.append(f"    • You have {active_vows} active vow(s)")
+        if entries_empty:
+            lines.append(_DESCRIBE_SITUATION)
 
     # Check character state
-    if state.character.health <= 2:
-        display.console.print(f"    • [{FEEDBACK_ERROR}]Your health is low[/{FEEDBACK_ERROR}]")
-        display.console.print(
-            f"      Consider: [{HINT_COMMAND}]/move heal[/{HINT_COMMAND}] or [{HINT_COMMAND}]/move resupply[/{HINT_COMMAND}]"
-        )
-
-    if state.character.momentum <= 2 and state.character.momentum >= 0:
-        display.console.print(f"    • [{FEEDBACK_WARN}]Your momentum is low[/{FEEDBACK_WARN}]")
-        display.console.print("      Consider making moves to gain momentum")
-
-    if state.character.supply <= 1:
-        display.console.print(
-            f"    • [{FEEDBACK_WARN}]Your supplies are running low[/{FEEDBACK_WARN}]"
-        )
-        display.console.print(f"      Consider: [{HINT_COMMAND}]/move resupply[/{HINT_COMMAND}]")
-
-    # Check session progress
-    if len(state.session.entries) == 0:
-        display.console.print()
-        display.console.print(f"    [{FEEDBACK_SUCCESS}]New session started![/{FEEDBACK_SUCCESS}]")
-        display.console.print(
-            "    [dim]Begin by describing where you are and what you're doing[/dim]"
-        )
-
-
-def _show_step_detail(step: str, state: GameState) -> None:
-    """Show detailed help for a specific step of the game loop."""
-    if step == "envision":
-        _show_envision_help(state)
-    elif step == "oracle":
-        _show_oracle_help(state)
-    elif step == "move":
-        _show_move_help(state)
-    elif step == "outcome":
-        _show_outcome_help(state)
-    elif step == "sector":
-        _show_sector_help(state)
-
-
-def _show_step_help(step: str, state: GameState, **format_kwargs: int) -> None:
-    """Show detailed help for a gameplay step, loaded from guide.toml."""
-    section = _GUIDE[step]
-    display.rule(section["title"])
-    display.console.print()
-    content = section["content"].format(**format_kwargs)
-    display.console.print(Panel(content, border_style=BORDER_REFERENCE, padding=(1, 2)))
-    display.console.print()
+    if character.health <= 2:
+        lines.append(_HEALTH_LOW)
 
+    if 0 <= character.momentum <= 2:
+        lines.append(_MOMENTUM_LOW)
 
-def _show_envision_help(state: GameState) -> None:
-    _show_step_help("envision", state)
+    if character.supply <= 1:
+        lines.append(_SUPPLY_LOW)
 
+    # Check session progress
+    if entries_empty:
+        lines.append(_NEW_SESSION)
 
-def _show_oracle_help(state: GameState) -> None:
-    _show_step_help("oracle", state, oracle_count=len(state.oracles))
+    display.console.print("\n".join(lines))
 
 
-def _show_move_help(state: GameState) -> None:
-    _show_step_help("move", state, move_count=len(state.moves))
+@functools.lru_cache(maxsize=32)
+def _step_panel(step: str, **format_kwargs: int) -> Panel:
+    """The guide.toml panel for a step; built once per distinct set of counts."""
+    content = _load_guide_prose()[step]["content"].format(**format_kwargs)
+    return Panel(content, border_style=BORDER_REFERENCE, padding=(1, 2))
 
 
-def _show_outcome_help(state: GameState) -> None:
-    _show_step_help("outcome", state)
+@display.batched()
+def _show_step_help(step: str, state: GameState, **format_kwargs: int) -> None:
+    """Show detailed help for a gameplay step, loaded from guide.toml."""
+    display.rule(_load_guide_prose()[step]["title"])
+    display.console.print()
+    display.console.print(_step_panel(step, **format_kwargs))
+    display.console.print()
 
 
-def _show_sector_help(state: GameState) -> None:
-    _show_step_help("sector", state)
+# Format counts for the guide.toml pages that interpolate them
+_STEP_COUNTS: dict[str, Callable[[GameState], dict[str, int]]] = {
+    "oracle": lambda state: {"oracle_count": len(state.oracles)},
+    "move": lambda state: {"move_count": len(state.moves)},
+}
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from prompt_toolkit.formatted_text import HTML
 from rich.prompt import Confirm, Prompt
+from rich.text import Text
 
 from wyrd.ui import display
 from wyrd.ui.theme import FEEDBACK_SUCCESS, HINT_COMMAND, MECHANIC_GUTTER, ORACLE_GUTTER
@@ -30,9 +33,158 @@ SECTOR_PHASES = [
     "sector_name",  # Step 11: name the sector
 ]
 
+# Fixed successor tables: the normal loop wraps around, the sector wizard runs once
+_NEXT_PHASE = dict(zip(_NORMAL_PHASES, _NORMAL_PHASES[1:] + _NORMAL_PHASES[:1], strict=True))
+_SECTOR_STEP = {phase: index for index, phase in enumerate(SECTOR_PHASES)}
+
+# Prompt colour per phase; sector phases all get amber/brightyellow
+_PHASE_COLORS = {
+    "envision": "cyan",
+    "oracle": "magenta",
+    "move": "yellow",
+    "outcome": "green",
+    **dict.fromkeys(SECTOR_PHASES, "ansibrightyellow"),
+}
+
+# Display label per phase: "oracle" -> "ORACLE", "sector_map" -> "MAP"
+_PHASE_LABELS = {phase: phase.upper().replace("SECTOR_", "") for phase in _PHASE_COLORS}
+
+# Plain separator closing each wizard intro
+_RULE_LINE = "  " + "-" * 76
+
 _SETTLEMENTS_BY_REGION = {"terminus": 4, "outlands": 3, "expanse": 2}
 _PASSAGES_BY_REGION = {"terminus": 3, "outlands": 2, "expanse": 1}
 
+# ── Normal phase help ───────────────────────────────────────────────────────────
+# Static per phase, so each block is rendered on first use and then reused.
+
+
+@dataclass(frozen=True)
+class _PhaseHelp:
+    """Content of one loop phase's help; every phase shares the same layout."""
+
+    title: str
+    color: str
+    bullets: tuple[str, ...]
+    example: str
+    next_steps: tuple[str, ...]
+
+
+_NEXT = f"[{HINT_COMMAND}]/next[/{HINT_COMMAND}]"
+
+_PHASE_HELP_DATA = {
+    "envision": _PhaseHelp(
+        title="ENVISION",
+        color=HINT_COMMAND,
+        bullets=(
+            "Describe what your character is doing",
+            "Write about the current situation",
+            "Just type (no command needed)",
+        ),
+        example="I approach the derelict station cautiously...",
+        next_steps=(f"When done, type {_NEXT} to move to ORACLE phase",),
+    ),
+    "oracle": _PhaseHelp(
+        title="ORACLE",
+        color=ORACLE_GUTTER,
+        bullets=(
+            "Ask questions about uncertain details",
+            f"Use [{HINT_COMMAND}]/oracle [[table]][/{HINT_COMMAND}] to get answers",
+            "Common oracles: action theme, descriptor, character",
+        ),
+        example="/oracle action theme",
+        next_steps=(
+            f"When done, type {_NEXT} to move to MOVE phase",
+            f"Or type {_NEXT} now to skip if no questions",
+        ),
+    ),
+    "move": _PhaseHelp(
+        title="MOVE",
+        color=MECHANIC_GUTTER,
+        bullets=(
+            "Make a move when taking risky action",
+            f"Use [{HINT_COMMAND}]/move [[name]][/{HINT_COMMAND}] to resolve",
+            "Common moves: face danger, strike, gather information",
+        ),
+        example="/move face danger",
+        next_steps=(f"After your move, type {_NEXT} to move to OUTCOME phase",),
+    ),
+    "outcome": _PhaseHelp(
+        title="OUTCOME",
+        color=FEEDBACK_SUCCESS,
+        bullets=(
+            "Describe what happens based on your result",
+            "Strong Hit - you're in control",
+            "Weak Hit - success with cost",
+            "Miss - things get worse",
+        ),
+        example="I succeed but alert the security systems...",
+        next_steps=(f"When done, type {_NEXT} to return to ENVISION",),
+    ),
+}
+
+
+@functools.cache
+def _render_phase_help(phase: str) -> Text:
+    info = _PHASE_HELP_DATA[phase]
+    lines = [
+        f"  [bold {info.color}]PHASE: {info.title}[/bold {info.color}]",
+        "",
+        "  [bold]What to do:[/bold]",
+        *(f"    • {bullet}" for bullet in info.bullets),
+        "",
+        "  [dim]Example:[/dim]",
+        f"  [dim]> {info.example}[/dim]",
+        "",
+    ]
+    for step in info.next_steps:
+        lines += [f"  [dim]{step}[/dim]", ""]
+    # render_str applies the same highlighting a plain console.print(str) would
+    return display.console.render_str("\n".join(lines))
+
+
+# ── Wizard welcome text ─────────────────────────────────────────────────────────
+
+_NORMAL_WELCOME = "\n".join(
+    [
+        "",
+        f"  [{FEEDBACK_SUCCESS}]Welcome to Guided Mode![/{FEEDBACK_SUCCESS}]",
+        "",
+        "  I'll walk you through the game loop step by step.",
+        f"  Your current phase will show in the prompt: [{HINT_COMMAND}][[ENVISION]] >[/{HINT_COMMAND}]",
+        "",
+        "  [dim]Commands in guided mode:[/dim]",
+        f"    [{HINT_COMMAND}]/guide stop[/{HINT_COMMAND}] - Exit guided mode",
+        f"    [{HINT_COMMAND}]/next[/{HINT_COMMAND}] - Advance to next phase",
+        f"    [{HINT_COMMAND}]/help[/{HINT_COMMAND}] - Show available commands",
+        "",
+        _RULE_LINE,
+        "",
+    ]
+)
+
+_SECTOR_WELCOME = "\n".join(
+    [
+        "",
+        f"  [{FEEDBACK_SUCCESS}]Starting sector creation wizard![/{FEEDBACK_SUCCESS}]",
+        "",
+        "  This wizard walks you through all 11 steps (pp. 114–126).",
+        "  Allow about 30–45 minutes.",
+        "",
+        "  [dim]Commands:[/dim]",
+        f"    [{HINT_COMMAND}]/next[/{HINT_COMMAND}]       — Advance to next step",
+        f"    [{HINT_COMMAND}]/guide stop[/{HINT_COMMAND}] — Exit wizard",
+        "",
+        # Step 1: Choose region interactively
+        "  [bold cyan]STEP 1: CHOOSE YOUR STARTING REGION[/bold cyan]",
+        "",
+        "  [bold]Terminus[/bold]  — Settled space, well-charted routes",
+        "  [bold]Outlands[/bold]  — Frontier, scattered and perilous",
+        "  [bold]Expanse[/bold]   — Deep unknown, lonely exploration",
+        "",
+    ]
+)
+
 
 def start_guided_mode(state: GameState, mode: str = "normal") -> None:
     """Enter guided mode. mode='normal' for gameplay loop, mode='sector' for sector wizard."""
@@ -42,56 +194,24 @@ def start_guided_mode(state: GameState, mode: str = "normal") -> None:
         _start_normal_guided(state)
 
 
+@display.batched()
 def _start_normal_guided(state: GameState) -> None:
     """Enter the standard envision→oracle→move→outcome guided loop."""
     state.guided_mode = True
     state.guided_phase = "envision"
 
     display.rule("Guided Mode Started")
-    display.console.print()
-    display.console.print(f"  [{FEEDBACK_SUCCESS}]Welcome to Guided Mode![/{FEEDBACK_SUCCESS}]")
-    display.console.print()
-    display.console.print("  I'll walk you through the game loop step by step.")
-    display.console.print(
-        f"  Your current phase will show in the prompt: [{HINT_COMMAND}][[ENVISION]] >[/{HINT_COMMAND}]"
-    )
-    display.console.print()
-    display.console.print("  [dim]Commands in guided mode:[/dim]")
-    display.console.print(f"    [{HINT_COMMAND}]/guide stop[/{HINT_COMMAND}] - Exit guided mode")
-    display.console.print(f"    [{HINT_COMMAND}]/next[/{HINT_COMMAND}] - Advance to next phase")
-    display.console.print(f"    [{HINT_COMMAND}]/help[/{HINT_COMMAND}] - Show available commands")
-    display.console.print()
-    display.console.print("  " + "-" * 76)
-    display.console.print()
+    display.console.print(display.static_text(_NORMAL_WELCOME))
 
     _show_phase_help(state)
 
 
 def _start_sector_wizard(state: GameState) -> None:
     """Enter the Build a Starting Sector wizard (pp. 114–126)."""
-    display.rule("Build a Starting Sector")
-    display.console.print()
-    display.console.print(
-        f"  [{FEEDBACK_SUCCESS}]Starting sector creation wizard![/{FEEDBACK_SUCCESS}]"
-    )
-    display.console.print()
-    display.console.print("  This wizard walks you through all 11 steps (pp. 114–126).")
-    display.console.print("  Allow about 30–45 minutes.")
-    display.console.print()
-    display.console.print("  [dim]Commands:[/dim]")
-    display.console.print(
-        f"    [{HINT_COMMAND}]/next[/{HINT_COMMAND}]       — Advance to next step"
-    )
-    display.console.print(f"    [{HINT_COMMAND}]/guide stop[/{HINT_COMMAND}] — Exit wizard")
-    display.console.print()
-
-    # Step 1: Choose region interactively
-    display.console.print("  [bold cyan]STEP 1: CHOOSE YOUR STARTING REGION[/bold cyan]")
-    display.console.print()
-    display.console.print("  [bold]Terminus[/bold]  — Settled space, well-charted routes")
-    display.console.print("  [bold]Outlands[/bold]  — Frontier, scattered and perilous")
-    display.console.print("  [bold]Expanse[/bold]   — Deep unknown, lonely exploration")
-    display.console.print()
+    # Batched up to the region prompt, which must be visible before it blocks
+    with display.batched():
+        display.rule("Build a Starting Sector")
+        display.console.print(display.static_text(_SECTOR_WELCOME))
 
     try:
         region = Prompt.ask(
@@ -107,13 +227,14 @@ def _start_sector_wizard(state: GameState) -> None:
     state.guided_phase = "sector_settlements"
     state.sector_region = region
 
-    display.console.print()
-    display.console.print(
-        f"  [{FEEDBACK_SUCCESS}]Region set: {region.capitalize()}[/{FEEDBACK_SUCCESS}]"
-    )
-    display.console.print("  " + "-" * 76)
-    display.console.print()
-    _show_phase_help(state)
+    with display.batched():
+        display.console.print()
+        display.console.print(
+            f"  [{FEEDBACK_SUCCESS}]Region set: {region.capitalize()}[/{FEEDBACK_SUCCESS}]"
+        )
+        display.console.print(_RULE_LINE)
+        display.console.print()
+        _show_phase_help(state)
 
 
 def stop_guided_mode(state: GameState) -> None:
@@ -124,9 +245,7 @@ def stop_guided_mode(state: GameState) -> None:
 
     try:
         if Confirm.ask("  Exit guided mode?", default=False):
-            state.guided_mode = False
-            state.guided_phase = "envision"
-            state.sector_region = None
+            _leave_guided_mode(state)
             display.success("Guided mode stopped. You're back to normal play.")
             display.console.print()
         else:
@@ -136,71 +255,71 @@ def stop_guided_mode(state: GameState) -> None:
         display.info("Staying in guided mode.")
 
 
+def _leave_guided_mode(state: GameState) -> None:
+    """Return to normal play, clearing any sector wizard progress."""
+    state.guided_mode = False
+    state.guided_phase = "envision"
+    state.sector_region = None
+
+
 def get_guided_prompt(state: GameState) -> str:
     """Get the prompt string with phase indicator (plain text for testing)."""
     if not state.guided_mode:
         return "> "
 
-    phase_display = state.guided_phase.upper().replace("SECTOR_", "")
-    return f"[{phase_display}] > "
+    phase = state.guided_phase
+    return _PROMPT_TEXT.get(phase) or f"[{_phase_label(phase)}] > "
 
 
 def get_guided_prompt_html(state: GameState) -> HTML:
     """Get the prompt with HTML-style formatting for prompt_toolkit."""
     if not state.guided_mode:
-        return HTML("> ")
-
-    color_map = {
-        "envision": "cyan",
-        "oracle": "magenta",
-        "move": "yellow",
-        "outcome": "green",
-        # Sector phases all get amber/brightyellow
-        "sector_settlements": "ansibrightyellow",
-        "sector_planets": "ansibrightyellow",
-        "sector_stars": "ansibrightyellow",
-        "sector_map": "ansibrightyellow",
-        "sector_passages": "ansibrightyellow",
-        "sector_zoom": "ansibrightyellow",
-        "sector_connection": "ansibrightyellow",
-        "sector_trouble": "ansibrightyellow",
-        "sector_name": "ansibrightyellow",
-    }
-
-    color = color_map.get(state.guided_phase, "white")
-    phase_display = state.guided_phase.upper().replace("SECTOR_", "")
+        return _PLAIN_PROMPT_HTML
+
+    phase = state.guided_phase
+    return _PROMPT_HTML.get(phase) or _build_prompt_html(phase, "white")
 
+
+def _phase_label(phase: str) -> str:
+    return _PHASE_LABELS.get(phase) or phase.upper().replace("SECTOR_", "")
+
+
+def _build_prompt_html(phase: str, color: str) -> HTML:
     return HTML(
-        f"<ansibrightblue>▌</ansibrightblue>\n<ansibrightblue>▌</ansibrightblue> <{color}>[{phase_display}]</{color}> "
+        f"<ansibrightblue>▌</ansibrightblue>\n<ansibrightblue>▌</ansibrightblue> <{color}>[{_phase_label(phase)}]</{color}> "
     )
 
 
+# One prompt per known phase, built once and reused on every redraw
+_PLAIN_PROMPT_HTML = HTML("> ")
+_PROMPT_HTML = {phase: _build_prompt_html(phase, color) for phase, color in _PHASE_COLORS.items()}
+_PROMPT_TEXT = {phase: f"[{label}] > " for phase, label in _PHASE_LABELS.items()}
+
+
+@display.batched()
 def advance_phase(state: GameState) -> None:
     """Advance to the next phase in the active game loop or sector wizard."""
     if not state.guided_mode:
         display.error("You're not in guided mode. Use /guide start to enter guided mode.")
         return
 
-    if state.guided_phase in SECTOR_PHASES:
+    if state.guided_phase in _SECTOR_STEP:
         _advance_sector_phase(state)
     else:
         _advance_normal_phase(state)
 
 
 def _advance_normal_phase(state: GameState) -> None:
-    current_index = _NORMAL_PHASES.index(state.guided_phase)
-    next_index = (current_index + 1) % len(_NORMAL_PHASES)
-    state.guided_phase = _NORMAL_PHASES[next_index]
+    state.guided_phase = _NEXT_PHASE[state.guided_phase]
 
     display.console.print()
-    display.success(f"Advanced to: {state.guided_phase.upper()}")
+    display.success(f"Advanced to: {_PHASE_LABELS[state.guided_phase]}")
     display.console.print()
     _show_phase_help(state)
 
 
 def _advance_sector_phase(state: GameState) -> None:
-    current_index = SECTOR_PHASES.index(state.guided_phase)
-    next_index = current_index + 1
+    next_index = _SECTOR_STEP[state.guided_phase] + 1
 
     if next_index >= len(SECTOR_PHASES):
         # All steps done
@@ -216,9 +335,7 @@ def _advance_sector_phase(state: GameState) -> None:
         display.console.print("    • Use [cyan]/vow[/cyan] to swear your first iron vow")
         display.console.print("    • Use [cyan]/guide[/cyan] to review the core gameplay loop")
         display.console.print()
-        state.guided_mode = False
-        state.guided_phase = "envision"
-        state.sector_region = None
+        _leave_guided_mode(state)
     else:
         state.guided_phase = SECTOR_PHASES[next_index]
         display.console.print()
@@ -227,89 +344,18 @@ def _advance_sector_phase(state: GameState) -> None:
         _show_phase_help(state)
 
 
+@display.batched()
 def _show_phase_help(state: GameState) -> None:
     """Show contextual help for the current phase."""
     phase = state.guided_phase
 
-    if phase in SECTOR_PHASES:
+    if phase in _SECTOR_STEP:
         _show_sector_phase_help(state)
         return
 
-    # Normal gameplay loop phases
-    if phase == "envision":
-        display.console.print(f"  [bold {HINT_COMMAND}]PHASE: ENVISION[/bold {HINT_COMMAND}]")
-        display.console.print()
-        display.console.print("  [bold]What to do:[/bold]")
-        display.console.print("    • Describe what your character is doing")
-        display.console.print("    • Write about the current situation")
-        display.console.print("    • Just type (no command needed)")
-        display.console.print()
-        display.console.print("  [dim]Example:[/dim]")
-        display.console.print("  [dim]> I approach the derelict station cautiously...[/dim]")
-        display.console.print()
-        display.console.print(
-            f"  [dim]When done, type [{HINT_COMMAND}]/next[/{HINT_COMMAND}] to move to ORACLE phase[/dim]"
-        )
-        display.console.print()
-
-    elif phase == "oracle":
-        display.console.print(f"  [bold {ORACLE_GUTTER}]PHASE: ORACLE[/bold {ORACLE_GUTTER}]")
-        display.console.print()
-        display.console.print("  [bold]What to do:[/bold]")
-        display.console.print("    • Ask questions about uncertain details")
-        display.console.print(
-            f"    • Use [{HINT_COMMAND}]/oracle [[table]][/{HINT_COMMAND}] to get answers"
-        )
-        display.console.print("    • Common oracles: action theme, descriptor, character")
-        display.console.print()
-        display.console.print("  [dim]Example:[/dim]")
-        display.console.print("  [dim]> /oracle action theme[/dim]")
-        display.console.print()
-        display.console.print(
-            f"  [dim]When done, type [{HINT_COMMAND}]/next[/{HINT_COMMAND}] to move to MOVE phase[/dim]"
-        )
-        display.console.print()
-        display.console.print(
-            f"  [dim]Or type [{HINT_COMMAND}]/next[/{HINT_COMMAND}] now to skip if no questions[/dim]"
-        )
-        display.console.print()
-
-    elif phase == "move":
-        display.console.print(f"  [bold {MECHANIC_GUTTER}]PHASE: MOVE[/bold {MECHANIC_GUTTER}]")
-        display.console.print()
-        display.console.print("  [bold]What to do:[/bold]")
-        display.console.print("    • Make a move when taking risky action")
-        display.console.print(
-            f"    • Use [{HINT_COMMAND}]/move [[name]][/{HINT_COMMAND}] to resolve"
-        )
-        display.console.print("    • Common moves: face danger, strike, gather information")
-        display.console.print()
-        display.console.print("  [dim]Example:[/dim]")
-        display.console.print("  [dim]> /move face danger[/dim]")
-        display.console.print()
-        display.console.print(
-            f"  [dim]After your move, type [{HINT_COMMAND}]/next[/{HINT_COMMAND}] to move to OUTCOME phase[/dim]"
-        )
-        display.console.print()
-
-    elif phase == "outcome":
-        display.console.print(
-            f"  [bold {FEEDBACK_SUCCESS}]PHASE: OUTCOME[/bold {FEEDBACK_SUCCESS}]"
-        )
-        display.console.print()
-        display.console.print("  [bold]What to do:[/bold]")
-        display.console.print("    • Describe what happens based on your result")
-        display.console.print("    • Strong Hit - you're in control")
-        display.console.print("    • Weak Hit - success with cost")
-        display.console.print("    • Miss - things get worse")
-        display.console.print()
-        display.console.print("  [dim]Example:[/dim]")
-        display.console.print("  [dim]> I succeed but alert the security systems...[/dim]")
-        display.console.print()
-        display.console.print(
-            f"  [dim]When done, type [{HINT_COMMAND}]/next[/{HINT_COMMAND}] to return to ENVISION[/dim]"
-        )
-        display.console.print()
+    # Normal gameplay loop phases are static; print the cached block
+    if phase in _PHASE_HELP_DATA:
+        display.console.print(_render_phase_help(phase))
 
 
 def _show_sector_phase_help(state: GameState) -> None:
@@ -508,8 +554,3 @@ def _show_sector_phase_help(state: GameState) -> None:
             f"  [dim]When done, type [{c}]/next[/{c}] to complete sector creation[/dim]"
         )
         display.console.print()
-
-
-def handle_guided_action(state: GameState, line: str) -> None:
-    """Handle special guided mode actions based on context."""
-    pass
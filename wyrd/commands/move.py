@@ -2,25 +2,39 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
+from rich.console import Group
+from rich.markdown import Markdown
+from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from rich.table import Table
+from rich.text import Text
 
 from wyrd.engine.dice import MixedDice, roll_action_dice, roll_challenge_dice, roll_oracle
 from wyrd.engine.moves import (
     MoveResult,
     OutcomeTier,
     check_match,
+    momentum_burn_outcome,
     resolve_move,
     resolve_outcome,
     would_momentum_improve,
 )
+from wyrd.models.vow import SPIRIT_COST, fuzzy_match_vow
 from wyrd.ui import display
 from wyrd.ui.theme import BORDER_ORACLE
 
 if TYPE_CHECKING:
     from wyrd.loop import GameState
 
+# Dataforged cross-reference link: [Move Name](Starforged/Moves/...)
+_MD_LINK = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+
+
+# ── Move lookup ──────────────────────────────────────────────────────────────────
+
 
 def fuzzy_match_move(query: str, move_data: dict, category_filter: str | None = None) -> list[str]:
     """Find moves matching a partial query string.
@@ -34,16 +48,12 @@ def fuzzy_match_move(query: str, move_data: dict, category_filter: str | None =
     if not q and not category_filter:
         return []
 
-    exact_matches = []
-    prefix_matches = []
-    substring_matches = []
-
     category_filter_lower = category_filter.lower() if category_filter else ""
+    exact_matches: list[str] = []
+    prefix_matches: list[str] = []
+    substring_matches: list[str] = []
 
-    for key in move_data:
-        move = move_data[key]
-
-        # Apply category filter if specified
+    for key, move in move_data.items():
         if category_filter and move.get("category", "").lower() != category_filter_lower:
             continue
 
@@ -53,18 +63,16 @@ def fuzzy_match_move(query: str, move_data: dict, category_filter: str | None =
             continue
 
         name_norm = move["name"].lower().replace(" ", "_")
-
-        # Check for exact match first
-        if q in (key, name_norm):
+        if key == q or name_norm == q:
             exact_matches.append(key)
-        # Then check for prefix match
+        elif exact_matches:
+            # Only the exact tier can be returned now; skip the remaining tests
+            continue
         elif key.startswith(q) or name_norm.startswith(q):
             prefix_matches.append(key)
-        # Finally check for substring match
-        elif q in key or q in name_norm:
+        elif not prefix_matches and (q in key or q in name_norm):
             substring_matches.append(key)
 
-    # Return in priority order: exact > prefix > substring
     return exact_matches or prefix_matches or substring_matches
 
 
@@ -178,11 +186,9 @@ def _execute_action_roll(state: GameState, move: dict, move_name: str, flags: se
 
     stat_val = state.character.stats.get(stat)
 
-    adds_raw = Prompt.ask("  Any adds?", default="0")
-    try:
-        adds = max(0, int(adds_raw))
-    except ValueError:
-        adds = 0
+    adds_raw = Prompt.ask("  Any adds?", default="0").strip().removeprefix("+")
+    # Negative or non-numeric adds count as none
+    adds = int(adds_raw) if adds_raw.isdecimal() else 0
 
     dice_result = roll_action_dice(state.dice)
     if dice_result is None:
@@ -227,14 +233,8 @@ def _maybe_burn_momentum(
     if not would_momentum_improve(result.outcome, state.character.momentum, c1, c2):
         return result
 
-    from wyrd.engine.moves import momentum_burn_outcome
-
     burn_tier = momentum_burn_outcome(state.character.momentum, c1, c2)
-    tier_label = {
-        OutcomeTier.STRONG_HIT: "Strong Hit",
-        OutcomeTier.WEAK_HIT: "Weak Hit",
-        OutcomeTier.MISS: "Miss",
-    }[burn_tier]
+    tier_label = _TIER_LABEL[burn_tier]
     display.warn(f"Burning momentum ({state.character.momentum:+d}) would upgrade to {tier_label}")
     if not Confirm.ask("  Burn momentum?", default=False):
         return result
@@ -258,10 +258,9 @@ def _maybe_burn_momentum(
 
 def _choose_stat(stat_options: list[str], state: GameState) -> str | None:
     """Choose a stat. Returns None if cancelled (Ctrl+C or typing 'cancel')."""
-    display.info("  Which stat?")
-    for i, s in enumerate(stat_options, 1):
-        val = state.character.stats.get(s)
-        display.info(f"    [{i}] {s.capitalize():<8} {val}")
+    stats = state.character.stats
+    menu = [f"    [{i}] {s.capitalize():<8} {stats.get(s)}" for i, s in enumerate(stat_options, 1)]
+    display.info("\n".join(["  Which stat?", *menu]))
 
     while True:
         try:
@@ -286,15 +285,30 @@ def _choose_stat(stat_options: list[str], state: GameState) -> str | None:
 
 # ── Outcome helpers ────────────────────────────────────────────────────────────
 
+# Outcome names as shown in prompts and as written to the session log
+_TIER_LABEL = {
+    OutcomeTier.STRONG_HIT: "Strong Hit",
+    OutcomeTier.WEAK_HIT: "Weak Hit",
+    OutcomeTier.MISS: "Miss",
+}
+_TIER_STR = {
+    OutcomeTier.STRONG_HIT: "STRONG HIT",
+    OutcomeTier.WEAK_HIT: "WEAK HIT",
+    OutcomeTier.MISS: "MISS",
+}
+
+
+# Move-data field holding each outcome's text, and the fallback when it's missing
+_OUTCOME_FIELD = {
+    OutcomeTier.STRONG_HIT: ("strong_hit", "Strong hit."),
+    OutcomeTier.WEAK_HIT: ("weak_hit", "Weak hit."),
+    OutcomeTier.MISS: ("miss", "Miss. Pay the Price."),
+}
+
 
 def _outcome_text(outcome: OutcomeTier, move: dict) -> str:
-    match outcome:
-        case OutcomeTier.STRONG_HIT:
-            return move.get("strong_hit", "Strong hit.")
-        case OutcomeTier.WEAK_HIT:
-            return move.get("weak_hit", "Weak hit.")
-        case OutcomeTier.MISS:
-            return move.get("miss", "Miss. Pay the Price.")
+    field, default = _OUTCOME_FIELD[outcome]
+    return move.get(field, default)
 
 
 def _apply_move_momentum(outcome: OutcomeTier, move: dict, state: GameState) -> int:
@@ -329,11 +343,7 @@ def _log_move(
             parts.append(f"adds({result.adds})")
         roll_str = "+".join(parts)
 
-    outcome_str = {
-        OutcomeTier.STRONG_HIT: "STRONG HIT",
-        OutcomeTier.WEAK_HIT: "WEAK HIT",
-        OutcomeTier.MISS: "MISS",
-    }[result.outcome]
+    outcome_str = _TIER_STR[result.outcome]
 
     match_str = " ⚡MATCH" if result.match else ""
     log = (
@@ -350,8 +360,6 @@ def _offer_pay_the_price(state: GameState, flags: set[str]) -> None:
     """On a miss, offer to roll Pay the Price oracle."""
     display.console.print()
     if Confirm.ask("  Roll Pay the Price oracle?", default=True):
-        from wyrd.engine.dice import roll_oracle
-
         table = state.oracles.get("pay_the_price")
         if not table:
             display.warn("Pay the Price oracle not found in data.")
@@ -370,18 +378,16 @@ def _offer_pay_the_price(state: GameState, flags: set[str]) -> None:
 
 def _select_vow(state: GameState):
     """Prompt the player to choose an active vow. Returns the vow or None."""
-    from wyrd.models.vow import fuzzy_match_vow
-
     active = [v for v in state.vows if not v.fulfilled]
     if not active:
         display.error("You have no active vows.")
         return None
 
-    display.info("  Which vow?")
-    for i, v in enumerate(active, 1):
-        display.info(
-            f"    [{i}] [{v.rank.value}] {v.description}  (progress {v.progress_score}/10)"
-        )
+    menu = [
+        f"    [{i}] [{v.rank.value}] {v.description}  (progress {v.progress_score}/10)"
+        for i, v in enumerate(active, 1)
+    ]
+    display.info("\n".join(["  Which vow?", *menu]))
 
     raw = Prompt.ask("  Vow number or name")
     if raw.isdigit():
@@ -456,11 +462,7 @@ def _handle_progress_roll(state: GameState, move_key: str, move: dict, flags: se
         display.success(f"Vow fulfilled: {vow.description}")
         state.session.add_mechanical(f"Vow fulfilled: {vow.description}")
 
-    outcome_str = {
-        OutcomeTier.STRONG_HIT: "STRONG HIT",
-        OutcomeTier.WEAK_HIT: "WEAK HIT",
-        OutcomeTier.MISS: "MISS",
-    }[outcome]
+    outcome_str = _TIER_STR[outcome]
     match_str = " ⚡MATCH" if match_flag else ""
     state.session.add_move(
         f"**{move_name}** | progress({progress_score}) vs [{c1}, {c2}] → {outcome_str}{match_str}"
@@ -481,20 +483,13 @@ _ORACLE_ODDS: list[tuple[str, int]] = [
 
 def _handle_ask_the_oracle(state: GameState, flags: set[str], move: dict | None = None) -> None:
     """Ask the Oracle — prompt for odds, roll d100, report yes/no."""
-    import re
-
-    from rich.console import Group
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-    from rich.text import Text
-
     category = move.get("category", "") if move else ""
     category_display = category.replace("_", " ").title() if category else "Move"
 
     description = ""
     if move:
         description = move.get("description", "")
-        description = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"**\1**", description)
+        description = _MD_LINK.sub(r"**\1**", description)
 
     odds_text = Text("\nChoose the odds:\n", style="bold")
     for i, (name, threshold) in enumerate(_ORACLE_ODDS, 1):
@@ -538,17 +533,16 @@ def _handle_ask_the_oracle(state: GameState, flags: set[str], move: dict | None
 
 def _handle_forsake_vow(state: GameState) -> None:
     """Forsake Your Vow — remove a vow and suffer spirit loss."""
-    from wyrd.models.vow import SPIRIT_COST, fuzzy_match_vow
-
     active = [v for v in state.vows if not v.fulfilled]
     if not active:
         display.error("No active vows to forsake.")
         return
 
-    display.info("  Which vow will you forsake?")
-    for i, v in enumerate(active, 1):
-        cost = SPIRIT_COST.get(v.rank, 1)
-        display.info(f"    [{i}] [{v.rank.value}] {v.description}  (spirit cost: -{cost})")
+    menu = [
+        f"    [{i}] [{v.rank.value}] {v.description}  (spirit cost: -{SPIRIT_COST.get(v.rank, 1)})"
+        for i, v in enumerate(active, 1)
+    ]
+    display.info("\n".join(["  Which vow will you forsake?", *menu]))
 
     raw = Prompt.ask("  Vow number or name")
     vow = None
@@ -590,8 +584,6 @@ def _list_all_moves(move_data: dict) -> None:
 
 def _display_category_moves(move_data: dict, keys: list[str], category: str) -> None:
     """Display a list of moves in a category with their short descriptions."""
-    from rich.table import Table
-
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("name", style="bold cyan", no_wrap=True)
     table.add_column("stats", style="dim blue", no_wrap=True)
@@ -616,9 +608,6 @@ def _display_category_moves(move_data: dict, keys: list[str], category: str) ->
 
 def _handle_narrative_move(move_name: str, move: dict, state: GameState) -> None:
     """Handle narrative/procedural moves that don't require dice rolls."""
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-
     description = move.get("description", "")
     category = move.get("category", "")
 
@@ -628,9 +617,7 @@ def _handle_narrative_move(move_name: str, move: dict, state: GameState) -> None
     # Strip dataforged cross-reference URLs before Markdown rendering.
     # [Move Name](Starforged/Moves/...) → Move Name (plain text).
     # This preserves table/bullet/bold formatting while avoiding non-functional links.
-    import re
-
-    description = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"**\1**", description)
+    description = _MD_LINK.sub(r"**\1**", description)
 
     content = Markdown(description) if description else "[dim]No description available[/dim]"
 
@@ -37,7 +37,7 @@ def _init_asset_tracks(char_asset: CharacterAsset, assets: dict[str, Asset]) ->
 
 # ── Oracle tables (loaded from TOML data file) ────────────────────────────────
 
-_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_DATA_DIR = Path(__file__).parent.parent / "data"
 
 
 def _load_creation_tables() -> dict[str, list[tuple]]:
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from wyrd.loop import GameState
 
 
-_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_DATA_DIR = Path(__file__).parent.parent / "data"
 
 
 @cache
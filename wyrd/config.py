@@ -4,10 +4,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
-CONFIG_DIR = Path.home() / ".config" / "wyrd"
+# Path.home() goes through the environment / passwd database; look it up once.
+_HOME = Path.home()
+
+CONFIG_DIR = _HOME / ".config" / "wyrd"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
 
+def _refresh_home() -> None:
+    """Re-read the home directory (e.g. after a test changes HOME)."""
+    global _HOME
+    _HOME = Path.home()
+
+
 class Config:
     """Shared configuration object.
 
@@ -30,7 +39,7 @@ class Config:
         if self._adventures_dir is not None:
             return self._adventures_dir
 
-        return Path.home() / "wyrd-adventures"
+        return _HOME / "wyrd-adventures"
 
     def set_adventures_dir(self, path: Path | str | None) -> None:
         """Set the adventures directory from CLI argument."""
@@ -51,6 +60,7 @@ class Config:
     def reset(self) -> None:
         """Reset config to defaults (useful for testing)."""
         self._adventures_dir = None
+        _refresh_home()
 
 
 config = Config()
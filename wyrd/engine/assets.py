@@ -93,7 +93,7 @@ def fuzzy_match_asset(query: str, assets: dict[str, Asset]) -> list[Asset]:
     substring_matches = []
 
     for key, asset in assets.items():
-        name_norm = asset.name.lower().replace(" ", "_")
+        name_norm = asset.name_norm
 
         # Check for exact match first
         if q in (key, name_norm):
@@ -107,3 +107,11 @@ def fuzzy_match_asset(query: str, assets: dict[str, Asset]) -> list[Asset]:
 
     # Return in priority order: exact > prefix > substring
     return exact_matches or prefix_matches or substring_matches
+
+
+def group_assets_by_category(assets: dict[str, Asset]) -> tuple[tuple[str, str], ...]:
+    """(category, comma-joined sorted names) pairs, sorted by category, for listings."""
+    categories: dict[str, list[str]] = {}
+    for asset in assets.values():
+        categories.setdefault(asset.category_display, []).append(asset.name)
+    return tuple((cat, ", ".join(sorted(names))) for cat, names in sorted(categories.items()))
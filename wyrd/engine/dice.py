@@ -4,12 +4,6 @@ from __future__ import annotations
 
 import random
 from enum import StrEnum
-from typing import Protocol
-
-from rich.prompt import Prompt
-
-from wyrd.ui.console import console
-from wyrd.ui.theme import FEEDBACK_WARN
 
 
 class DiceMode(StrEnum):
@@ -30,17 +24,17 @@ DIE_RANGES: dict[Die, tuple[int, int]] = {
     Die.D100: (1, 100),
 }
 
-
-class DiceProvider(Protocol):
-    def roll(self, die: Die) -> int: ...
+# (low, high + 1) per die, so DigitalDice can call randrange without randint's +1 wrapper
+_DIE_BOUNDS: dict[Die, tuple[int, int]] = {
+    die: (low, high + 1) for die, (low, high) in DIE_RANGES.items()
+}
 
 
 class DigitalDice:
     """Rolls dice using Python's random module."""
 
     def roll(self, die: Die) -> int:
-        low, high = DIE_RANGES[die]
-        return random.randint(low, high)
+        return random.randrange(*_DIE_BOUNDS[die])
 
 
 class PhysicalDice:
@@ -48,6 +42,11 @@ class PhysicalDice:
 
     def roll(self, die: Die) -> int | None:
         """Prompt for a die roll. Returns None if cancelled (Ctrl+C or typing 'cancel')."""
+        from rich.prompt import Prompt
+
+        from wyrd.ui.console import console
+        from wyrd.ui.theme import FEEDBACK_WARN
+
         low, high = DIE_RANGES[die]
         while True:
             try:
@@ -88,14 +87,15 @@ class MixedDice:
         self._force_physical = enabled
 
 
+_PROVIDERS: dict[DiceMode, type[DigitalDice | PhysicalDice | MixedDice]] = {
+    DiceMode.DIGITAL: DigitalDice,
+    DiceMode.PHYSICAL: PhysicalDice,
+    DiceMode.MIXED: MixedDice,
+}
+
+
 def make_dice_provider(mode: DiceMode) -> DigitalDice | PhysicalDice | MixedDice:
-    match mode:
-        case DiceMode.DIGITAL:
-            return DigitalDice()
-        case DiceMode.PHYSICAL:
-            return PhysicalDice()
-        case DiceMode.MIXED:
-            return MixedDice()
+    return _PROVIDERS[mode]()
 
 
 def roll_action_dice(
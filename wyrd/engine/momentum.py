@@ -8,7 +8,7 @@ MOMENTUM_RESET_DEFAULT = 2
 
 
 def clamp_momentum(value: int) -> int:
-    return max(MOMENTUM_MIN, min(MOMENTUM_MAX, value))
+    return MOMENTUM_MIN if value < MOMENTUM_MIN else MOMENTUM_MAX if value > MOMENTUM_MAX else value
 
 
 def momentum_after_burn(current: int) -> int:
@@ -18,4 +18,7 @@ def momentum_after_burn(current: int) -> int:
 
 def adjust_momentum(current: int, delta: int, max_momentum: int = MOMENTUM_MAX) -> int:
     """Apply a delta to momentum, clamped to valid range."""
-    return max(MOMENTUM_MIN, min(max_momentum, current + delta))
+    value = current + delta
+    if value > max_momentum:
+        value = max_momentum
+    return MOMENTUM_MIN if value < MOMENTUM_MIN else value
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import StrEnum
+from typing import NamedTuple
 
 
 class OutcomeTier(StrEnum):
@@ -12,8 +12,12 @@ class OutcomeTier(StrEnum):
     MISS = "miss"
 
 
-@dataclass(frozen=True)
-class MoveResult:
+# Indexed by the number of challenge dice beaten (0, 1 or 2)
+_OUTCOMES = (OutcomeTier.MISS, OutcomeTier.WEAK_HIT, OutcomeTier.STRONG_HIT)
+_TIER_RANK = {tier: rank for rank, tier in enumerate(_OUTCOMES)}
+
+
+class MoveResult(NamedTuple):
     action_die: int
     stat: int
     adds: int
@@ -34,16 +38,14 @@ class MoveResult:
         return self.action_score > self.challenge_2
 
 
+def _outcome_rank(action_score: int, c1: int, c2: int) -> int:
+    """Number of challenge dice beaten: 0 (miss), 1 (weak hit), 2 (strong hit)."""
+    return (action_score > c1) + (action_score > c2)
+
+
 def resolve_outcome(action_score: int, c1: int, c2: int) -> OutcomeTier:
     """Determine outcome tier from action score vs challenge dice."""
-    beats = (action_score > c1) + (action_score > c2)
-    match beats:
-        case 2:
-            return OutcomeTier.STRONG_HIT
-        case 1:
-            return OutcomeTier.WEAK_HIT
-        case _:
-            return OutcomeTier.MISS
+    return _OUTCOMES[_outcome_rank(action_score, c1, c2)]
 
 
 def check_match(c1: int, c2: int) -> bool:
@@ -62,11 +64,10 @@ def would_momentum_improve(
     c2: int,
 ) -> bool:
     """Return True if burning momentum would improve the current outcome."""
-    if momentum <= 0:
+    # Nothing beats a strong hit, and momentum that doesn't beat either die is still a miss
+    if current_outcome is OutcomeTier.STRONG_HIT or momentum <= min(c1, c2):
         return False
-    burn_outcome = momentum_burn_outcome(momentum, c1, c2)
-    tier_rank = {OutcomeTier.MISS: 0, OutcomeTier.WEAK_HIT: 1, OutcomeTier.STRONG_HIT: 2}
-    return tier_rank[burn_outcome] > tier_rank[current_outcome]
+    return _outcome_rank(momentum, c1, c2) > _TIER_RANK[current_outcome]
 
 
 def resolve_move(
@@ -35,7 +35,7 @@ from wyrd.commands.session import (
 )
 from wyrd.commands.truths import handle_truths
 from wyrd.commands.vow import handle_fulfill, handle_progress, handle_vow
-from wyrd.engine.assets import load_assets
+from wyrd.engine.assets import group_assets_by_category, load_assets
 from wyrd.engine.dice import (
     DiceMode,
     DigitalDice,
@@ -103,6 +103,8 @@ class GameState:
     last_oracle_event_id: str | None = field(default=None, repr=False)
     pending_partner_interpretation: object = field(default=None, repr=False)  # Event | None
     last_proposed_truth_category: str | None = field(default=None, repr=False)
+    # (category, joined names) pairs for /asset; built once since the catalog is fixed
+    assets_by_category: tuple[tuple[str, str], ...] = field(default=(), repr=False)
 
 
 def load_dataforged_moves() -> dict:
@@ -286,6 +288,7 @@ def _build_game_state(
         oracles=oracles,
         assets=assets,
         truth_categories=truth_categories,
+        assets_by_category=group_assets_by_category(assets),
         sync=sync,
         campaign=campaign,
         campaign_dir=campaign_dir,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -36,6 +37,16 @@ class Asset:
     inputs: list[str] = field(default_factory=list)  # custom input field names
     shared: bool = False
 
+    @cached_property
+    def name_norm(self) -> str:
+        """Lowercased, underscore-joined name used for fuzzy lookups."""
+        return self.name.lower().replace(" ", "_")
+
+    @cached_property
+    def category_display(self) -> str:
+        """Human-readable category, e.g. 'command_vehicle' -> 'Command Vehicle'."""
+        return self.category.replace("_", " ").title()
+
 
 @dataclass
 class CharacterAsset:
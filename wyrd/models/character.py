@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from wyrd.models.asset import CharacterAsset
 from wyrd.models.truths import ChosenTruth
@@ -20,14 +21,21 @@ DEBILITY_NAMES = [
     "maimed",
     "corrupted",
 ]
+_DEBILITY_BITS = {name: 1 << i for i, name in enumerate(DEBILITY_NAMES)}
 
 TRACK_MAX = 5
 MOMENTUM_MIN = -6
 MOMENTUM_MAX_BASE = 10
 MOMENTUM_RESET_BASE = 2
 
+STAT_NAMES = ("edge", "heart", "iron", "shadow", "wits")
+_STAT_GETTERS = {name: attrgetter(name) for name in STAT_NAMES}
 
-@dataclass
+TRACK_NAMES = ("health", "spirit", "supply")
+_TRACK_GETTERS = {name: attrgetter(name) for name in TRACK_NAMES}
+
+
+@dataclass(slots=True)
 class Stats:
     edge: int = 1
     heart: int = 1
@@ -37,10 +45,10 @@ class Stats:
 
     def get(self, name: str) -> int:
         """Get a stat by name. Raises ValueError if stat name is invalid."""
-        name_lower = name.lower()
-        if name_lower not in ("edge", "heart", "iron", "shadow", "wits"):
+        getter = _STAT_GETTERS.get(name) or _STAT_GETTERS.get(name.lower())
+        if getter is None:
             raise ValueError(f"Invalid stat name: {name}")
-        return getattr(self, name_lower)
+        return getter(self)
 
     def as_dict(self) -> dict[str, int]:
         return {
@@ -52,7 +60,7 @@ class Stats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     name: str
     homeworld: str = ""
@@ -66,8 +74,8 @@ class Character:
     # Momentum (MOMENTUM_MIN to momentum_max, modified by debilities)
     momentum: int = MOMENTUM_RESET_BASE
 
-    # Debilities — stored as set of active debility names
-    debilities: set[str] = field(default_factory=set)
+    # Debilities — one bit per entry in DEBILITY_NAMES; see the debilities property
+    debility_mask: int = 0
 
     # Assets — instances with progression tracking
     assets: list[CharacterAsset] = field(default_factory=list)
@@ -85,26 +93,42 @@ class Character:
     gear: list[str] = field(default_factory=list)
 
     # ── Computed momentum bounds ────────────────────────────────────────────
-    @property
-    def momentum_max(self) -> int:
-        """Max momentum decreases by 1 per active debility."""
-        return max(0, MOMENTUM_MAX_BASE - len(self.debilities))
+    # Derived from debilities; refreshed whenever a debility is toggled.
+    momentum_max: int = field(init=False, repr=False, compare=False)
+    momentum_reset: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_momentum_bounds()
 
     @property
-    def momentum_reset(self) -> int:
-        """Reset value drops to 0 if 2+ debilities are active."""
-        return 0 if len(self.debilities) >= 2 else MOMENTUM_RESET_BASE
+    def debilities(self) -> frozenset[str]:
+        """Names of the active debilities."""
+        mask = self.debility_mask
+        return frozenset(name for name, bit in _DEBILITY_BITS.items() if mask & bit)
+
+    def _refresh_momentum_bounds(self) -> None:
+        """Max drops by 1 per active debility; reset drops to 0 at 2+ debilities."""
+        count = self.debility_mask.bit_count()
+        self.momentum_max = max(0, MOMENTUM_MAX_BASE - count)
+        self.momentum_reset = 0 if count >= 2 else MOMENTUM_RESET_BASE
+
+    def get_track(self, track: str) -> int:
+        """Current value of a track (health/spirit/supply)."""
+        return _TRACK_GETTERS[track](self)
 
     def adjust_track(self, track: str, delta: int) -> int:
         """Adjust a track (health/spirit/supply) by delta, clamped 0–TRACK_MAX. Returns new value."""
-        current = getattr(self, track)
-        new_val = max(0, min(TRACK_MAX, current + delta))
+        new_val = _TRACK_GETTERS[track](self) + delta
+        new_val = 0 if new_val < 0 else TRACK_MAX if new_val > TRACK_MAX else new_val
         setattr(self, track, new_val)
         return new_val
 
     def adjust_momentum(self, delta: int) -> int:
         """Adjust momentum, clamped MOMENTUM_MIN to momentum_max. Returns new value."""
-        self.momentum = max(MOMENTUM_MIN, min(self.momentum_max, self.momentum + delta))
+        value = self.momentum + delta
+        if value > self.momentum_max:
+            value = self.momentum_max
+        self.momentum = MOMENTUM_MIN if value < MOMENTUM_MIN else value
         return self.momentum
 
     def burn_momentum(self) -> int:
@@ -115,19 +139,16 @@ class Character:
 
     def toggle_debility(self, name: str) -> bool | None:
         """Toggle a debility on/off. Returns True if now active, False if removed, None if invalid."""
-        name = name.lower()
-        if name not in DEBILITY_NAMES:
+        bit = _DEBILITY_BITS.get(name.lower())
+        if bit is None:
             # Return None instead of raising to allow graceful handling
             return None
-        if name in self.debilities:
-            self.debilities.discard(name)
-            # Re-clamp momentum to new max
-            self.momentum = min(self.momentum, self.momentum_max)
-            return False
-        else:
-            self.debilities.add(name)
-            self.momentum = min(self.momentum, self.momentum_max)
-            return True
+        self.debility_mask ^= bit
+        active = bool(self.debility_mask & bit)
+        self._refresh_momentum_bounds()
+        # Re-clamp momentum to new max
+        self.momentum = min(self.momentum, self.momentum_max)
+        return active
 
     def to_dict(self) -> dict:
         return {
@@ -138,7 +159,9 @@ class Character:
             "spirit": self.spirit,
             "supply": self.supply,
             "momentum": self.momentum,
-            "debilities": sorted(self.debilities),
+            "debilities": [
+                name for name, bit in _DEBILITY_BITS.items() if self.debility_mask & bit
+            ],
             "assets": [a.to_dict() for a in self.assets],
             "pronouns": self.pronouns,
             "callsign": self.callsign,
@@ -157,6 +180,10 @@ class Character:
         assets_data = data.get("assets", [])
         assets = [CharacterAsset.from_dict(item) for item in assets_data]
 
+        debility_mask = 0
+        for name in data.get("debilities", []):
+            debility_mask |= _DEBILITY_BITS.get(name, 0)
+
         # Handle truths
         truths_data = data.get("truths", [])
         truths = [ChosenTruth.from_dict(t) for t in truths_data]
@@ -169,7 +196,7 @@ class Character:
             spirit=data.get("spirit", TRACK_MAX),
             supply=data.get("supply", TRACK_MAX),
             momentum=data.get("momentum", MOMENTUM_RESET_BASE),
-            debilities=set(data.get("debilities", [])),
+            debility_mask=debility_mask,
             assets=assets,
             truths=truths,
             pronouns=data.get("pronouns", ""),
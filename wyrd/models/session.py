@@ -15,6 +15,10 @@ class EntryKind(StrEnum):
     NOTE = "note"
 
 
+# Plain value → member map; cheaper than EntryKind(value) when loading long logs
+_ENTRY_KINDS: dict[str, EntryKind] = {k.value: k for k in EntryKind}
+
+
 @dataclass
 class LogEntry:
     kind: EntryKind
@@ -34,8 +38,10 @@ class LogEntry:
 
     @classmethod
     def from_dict(cls, data: dict) -> LogEntry:
+        kind = data["kind"]
         return cls(
-            kind=EntryKind(data["kind"]),
+            # Unknown kinds fall through to EntryKind() so they still raise ValueError
+            kind=_ENTRY_KINDS.get(kind) or EntryKind(kind),
             text=data["text"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
             player=data.get("player"),
@@ -25,6 +25,8 @@ PROGRESS_TICKS: dict[VowRank, int] = {
 
 MAX_TICKS = 40  # 10 boxes × 4 ticks
 
+_VOW_RANKS: dict[str, VowRank] = {r.value: r for r in VowRank}
+
 
 @dataclass
 class Vow:
@@ -34,6 +36,11 @@ class Vow:
     fulfilled: bool = False
     shared: bool = False  # True = campaign-level vow, visible to all players
 
+    @property
+    def description_lower(self) -> str:
+        """Lowercased description used for fuzzy lookups."""
+        return self.description.lower()
+
     @property
     def progress_score(self) -> int:
         """Progress score for fulfillment roll (ticks // 4, max 10)."""
@@ -67,10 +74,7 @@ class Vow:
     @classmethod
     def from_dict(cls, data: dict) -> Vow:
         """Load vow from dict. Defaults to DANGEROUS rank if invalid rank in data."""
-        try:
-            rank = VowRank(data["rank"])
-        except (ValueError, KeyError):
-            rank = VowRank.DANGEROUS  # safe default if rank is invalid
+        rank = _VOW_RANKS.get(data.get("rank"), VowRank.DANGEROUS)  # safe default if invalid
 
         return cls(
             description=data.get("description", "Unknown vow"),
@@ -83,7 +87,7 @@ class Vow:
 
 def fuzzy_match_vow(query: str, vows: list[Vow]) -> list[Vow]:
     q = query.lower()
-    return [v for v in vows if q in v.description.lower()]
+    return [v for v in vows if q in v.description_lower]
 
 
 # Spirit cost when forsaking a vow, by rank
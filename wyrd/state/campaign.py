@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import tomllib
 from datetime import UTC, datetime
 from pathlib import Path
@@ -79,6 +81,43 @@ def list_campaigns() -> list[str]:
     return [p.name for p in sorted(base.iterdir()) if p.is_dir()]
 
 
+@functools.lru_cache(maxsize=64)
+def _read_player_ids(toml_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Player ids from a campaign.toml, keyed on its mtime so edits are re-read."""
+    with open(toml_path, "rb") as f:
+        data = tomllib.load(f)
+    players = data.get("players", {})
+    if not isinstance(players, dict):
+        raise TypeError(f"players must be a table, got {type(players).__name__}")
+    return tuple(players)
+
+
+def scan_campaigns() -> list[tuple[str, tuple[str, ...] | None]]:
+    """Return (slug, player ids) for every campaign, sorted by slug.
+
+    A lighter alternative to list_campaigns() + load_campaign() for listings:
+    one scandir pass and no CampaignState construction. Player ids are None
+    when a campaign.toml is missing or unreadable.
+    """
+    base = campaigns_dir()
+    if not base.exists():
+        return []
+    rows: list[tuple[str, tuple[str, ...] | None]] = []
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            toml_path = os.path.join(entry.path, "campaign.toml")
+            try:
+                players = _read_player_ids(toml_path, os.stat(toml_path).st_mtime_ns)
+            except (OSError, ValueError, TypeError):
+                # Missing, non-UTF-8, malformed or mis-shaped: list it as unreadable
+                players = None
+            rows.append((entry.name, players))
+    rows.sort()
+    return rows
+
+
 def load_campaign(campaign_dir: Path) -> CampaignState:
     """Load campaign.toml from a campaign directory."""
     toml_path = campaign_dir / "campaign.toml"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import json
+import shutil
 from pathlib import Path
 
 from wyrd.config import config
@@ -107,10 +108,9 @@ def save_game(
         save_path.parent.mkdir(parents=True, exist_ok=True)
         path = save_path
 
-    # Create backup if save file exists
+    # Create backup if save file exists (byte copy; no need to decode it first)
     if path.exists():
-        backup_path = path.with_suffix(".json.bak")
-        backup_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+        shutil.copyfile(path, path.with_suffix(".json.bak"))
 
     data = {
         "character": character.to_dict(),
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from rich.markdown import Markdown
@@ -49,6 +51,10 @@ from wyrd.ui.theme import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from rich.text import Text
+
     from wyrd.models.asset import Asset, CharacterAsset
 
 # Legacy aliases preserved for external uses
@@ -61,6 +67,18 @@ STAT_COLOR = f"bold {MECHANIC_STAT}"
 HEADER = "bold white"
 
 
+@contextmanager
+def batched() -> Iterator[None]:
+    """Buffer console output and write it to the terminal once, on exit.
+
+    Every print still renders its markup, but the terminal sees a single write
+    per block. Only use this around non-interactive output: a prompt issued
+    inside the block would not be shown until the block exits.
+    """
+    with console:
+        yield
+
+
 def render_game_text(text: str) -> str:
     """Convert dataforged markdown to Rich markup for in-panel display.
 
@@ -102,8 +120,18 @@ def splash(character: Character | None = None, vows: list[Vow] | None = None) ->
     console.print()
 
 
+# Untitled separator, shared by every display.rule() call
+_PLAIN_RULE = Rule(style=STRUCTURE_RULE)
+
+
+@functools.cache
+def static_text(markup: str) -> Text:
+    """Fixed markup parsed on first use and reused; prints like console.print(markup)."""
+    return console.render_str(markup)
+
+
 def rule(title: str = "") -> None:
-    console.print(Rule(title, style=STRUCTURE_RULE))
+    console.print(Rule(title, style=STRUCTURE_RULE) if title else _PLAIN_RULE)
 
 
 def move_result_panel(